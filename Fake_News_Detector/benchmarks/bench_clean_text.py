@@ -0,0 +1,57 @@
+"""
+Microbenchmark for the clean_text normalization stage.
+Compares the legacy four-regex pipeline against the fused single-pass
+tokenizer on the bundled data/raw archives and checks they agree.
+
+    python -m benchmarks.bench_clean_text --repeat 20
+"""
+import argparse
+import time
+import pandas as pd
+from src.preprocessing import (
+    URL_PATTERN, PUNCT_PATTERN, NUM_PATTERN, WHITESPACE_PATTERN, normalize_tokens
+)
+
+def legacy_tokens(text):
+    text = text.lower()
+    text = URL_PATTERN.sub('', text)
+    text = PUNCT_PATTERN.sub('', text)
+    text = NUM_PATTERN.sub('', text)
+    text = WHITESPACE_PATTERN.sub(' ', text).strip()
+    return text.split()
+
+def load_corpus(true_csv, fake_csv):
+    df = pd.concat([pd.read_csv(true_csv), pd.read_csv(fake_csv)])
+    return (df['title'].fillna('') + " " + df['text'].fillna('')).tolist()
+
+def time_pass(fn, texts, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for t in texts:
+            fn(t)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--true-csv", default="data/raw/True.csv")
+    parser.add_argument("--fake-csv", default="data/raw/Fake.csv")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    texts = load_corpus(args.true_csv, args.fake_csv)
+    mismatches = sum(legacy_tokens(t) != normalize_tokens(t) for t in texts)
+    if mismatches:
+        raise SystemExit(f"[BENCH] {mismatches} documents differ between pipelines")
+
+    legacy = time_pass(legacy_tokens, texts, args.repeat)
+    fused = time_pass(normalize_tokens, texts, args.repeat)
+    chars = sum(len(t) for t in texts)
+    print(f"[BENCH] {len(texts)} docs / {chars / 1e6:.2f}M chars, best of {args.repeat}")
+    print(f"[BENCH] legacy 4-pass : {legacy * 1e3:8.2f} ms ({len(texts) / legacy:,.0f} docs/s)")
+    print(f"[BENCH] fused 1-pass  : {fused * 1e3:8.2f} ms ({len(texts) / fused:,.0f} docs/s)")
+    print(f"[BENCH] speedup       : {legacy / fused:.2f}x (outputs identical)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Recall/latency benchmark for related-article search backends.
+Builds a synthetic topic-structured TF-IDF archive, then compares
+AetherLSHSearch configurations against exact search on recall@k
+and per-query latency percentiles.
+
+    python -m benchmarks.bench_related_search --docs 200000
+"""
+import argparse
+import time
+import numpy as np
+import scipy.sparse as sp
+from sklearn.preprocessing import normalize
+from src.ann import AetherExactSearch, AetherLSHSearch
+
+def synthetic_archive(n_docs, n_features, n_topics, terms_per_doc, seed):
+    """
+    Documents draw most terms from one topic's Zipfian vocabulary slice,
+    the rest from the global vocabulary, like clustered news coverage.
+    """
+    rng = np.random.default_rng(seed)
+    topic_terms = rng.integers(0, n_features, size=(n_topics, 200))
+    zipf = 1.0 / np.arange(1, 201)
+    zipf /= zipf.sum()
+    topics = rng.integers(0, n_topics, size=n_docs)
+    on_topic = int(terms_per_doc * 0.7)
+    cols = np.concatenate([
+        topic_terms[topics[:, None], rng.choice(200, size=(n_docs, on_topic), p=zipf)],
+        rng.integers(0, n_features, size=(n_docs, terms_per_doc - on_topic))
+    ], axis=1)
+    rows = np.repeat(np.arange(n_docs), terms_per_doc)
+    data = rng.random(rows.shape[0]).astype(np.float32) + 0.1
+    matrix = sp.csr_matrix((data, (rows, cols.ravel())), shape=(n_docs, n_features))
+    matrix.sum_duplicates()
+    return normalize(matrix, norm='l2')
+
+def run(backend, matrix, queries, k):
+    latencies, results = [], []
+    for q in queries:
+        start = time.perf_counter()
+        rows, _ = backend.search(q, k)
+        latencies.append(time.perf_counter() - start)
+        results.append(set(rows.tolist()))
+    return np.array(latencies) * 1e3, results
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--docs", type=int, default=100000)
+    parser.add_argument("--features", type=int, default=5000)
+    parser.add_argument("--topics", type=int, default=500)
+    parser.add_argument("--terms", type=int, default=60)
+    parser.add_argument("--queries", type=int, default=300)
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    matrix = synthetic_archive(args.docs, args.features, args.topics, args.terms, args.seed)
+    rng = np.random.default_rng(args.seed + 1)
+    queries = [matrix[i] for i in rng.choice(args.docs, size=args.queries, replace=False)]
+    print(f"[BENCH] archive {args.docs:,} docs x {args.features:,} features, {args.queries} queries, k={args.k}")
+
+    exact_lat, truth = run(AetherExactSearch().fit(matrix), matrix, queries, args.k)
+    print(f"{'backend':<28}{'build s':>9}{'recall@k':>10}{'p50 ms':>9}{'p99 ms':>9}")
+    print(f"{'exact':<28}{'-':>9}{1.0:>10.3f}{np.percentile(exact_lat, 50):>9.2f}{np.percentile(exact_lat, 99):>9.2f}")
+
+    for n_tables, n_bits, n_probes in [(4, 16, 0), (8, 16, 2), (16, 14, 4), (32, 12, 4)]:
+        start = time.perf_counter()
+        backend = AetherLSHSearch(n_tables=n_tables, n_bits=n_bits, n_probes=n_probes, seed=args.seed).fit(matrix)
+        build = time.perf_counter() - start
+        lat, found = run(backend, matrix, queries, args.k)
+        recall = np.mean([len(f & t) / len(t) for f, t in zip(found, truth)])
+        label = f"lsh T={n_tables} B={n_bits} P={n_probes}"
+        print(f"{label:<28}{build:>9.2f}{recall:>10.3f}{np.percentile(lat, 50):>9.2f}{np.percentile(lat, 99):>9.2f}")
+
+if __name__ == "__main__":
+    main()
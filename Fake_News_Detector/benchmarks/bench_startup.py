@@ -0,0 +1,97 @@
+"""
+Startup/import-time benchmark for the Sentinel entry points.
+Runs each entry point in a fresh interpreter under `python -X importtime`,
+reports cumulative import cost and the heaviest modules, and fails if a
+heavy dependency is imported eagerly or a saved baseline regresses.
+
+    python -m benchmarks.bench_startup --save benchmarks/startup_baseline.json
+    python -m benchmarks.bench_startup --compare benchmarks/startup_baseline.json
+"""
+import argparse
+import json
+import re
+import subprocess
+import sys
+
+ENTRY_POINTS = {
+    # Everything app.py imports before the first page paint
+    "app": "import src.registry, src.async_explain, src.history, src.cache, src.corpus_cache",
+    "inference": "import src.inference",
+    "explain": "import src.explain",
+    "compact": "import src.export",
+    "training": "import src.training",
+    "train_cli": "import train",
+}
+
+# Heavy packages each entry point must only load on first use
+FORBIDDEN = {
+    "app": ("shap", "matplotlib", "nltk", "sklearn", "pandas"),
+    "inference": ("shap", "matplotlib", "nltk", "sklearn", "pandas"),
+    "explain": ("shap", "matplotlib", "pandas", "sklearn"),
+    "compact": ("sklearn", "scipy", "pandas", "nltk"),
+    "training": ("shap", "matplotlib", "nltk"),
+    "train_cli": ("shap", "matplotlib", "nltk"),
+}
+
+LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+def profile_imports(statement):
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True, text=True, check=True
+    )
+    modules = {}
+    total_us = 0
+    for line in proc.stderr.splitlines():
+        match = LINE.match(line)
+        if not match:
+            continue
+        _, cumulative, indent, name = match.groups()
+        modules[name] = int(cumulative)
+        if len(indent) == 1:
+            total_us += int(cumulative)
+    return total_us / 1e3, modules
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--top", type=int, default=5, help="Heaviest modules to list per entry point.")
+    parser.add_argument("--save", help="Write measured import times (ms) to this JSON baseline.")
+    parser.add_argument("--compare", help="Baseline JSON to check against.")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative slowdown vs baseline.")
+    parser.add_argument("--slack-ms", type=float, default=50.0, help="Absolute slowdown ignored as noise.")
+    parser.add_argument("--repeat", type=int, default=3, help="Fresh interpreters per entry point (best run kept).")
+    args = parser.parse_args()
+
+    results, failures = {}, []
+    for name, statement in ENTRY_POINTS.items():
+        total_ms, modules = min((profile_imports(statement) for _ in range(args.repeat)), key=lambda r: r[0])
+        results[name] = round(total_ms, 1)
+        print(f"[BENCH] {name:<10} {total_ms:8.1f} ms  ({statement})")
+        heaviest = sorted(modules.items(), key=lambda kv: kv[1], reverse=True)
+        own = set(re.findall(r"[\w.]+", statement.replace("import", "")))
+        external = [kv for kv in heaviest if kv[0] not in own and not kv[0].startswith("src.")]
+        for mod, cumulative in external[:args.top]:
+            print(f"          {cumulative / 1e3:8.1f} ms  {mod}")
+        eager = [pkg for pkg in FORBIDDEN.get(name, ()) if pkg in modules]
+        if eager:
+            failures.append(f"{name} eagerly imports {', '.join(eager)}")
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"[BENCH] Baseline written to {args.save}")
+
+    if args.compare:
+        with open(args.compare, "r") as f:
+            baseline = json.load(f)
+        for name, ms in results.items():
+            ref = baseline.get(name)
+            if ref and ms > ref * (1 + args.tolerance) and ms - ref > args.slack_ms:
+                failures.append(f"{name} import time {ms:.1f} ms vs baseline {ref:.1f} ms")
+
+    for failure in failures:
+        print(f"[REGRESSION] {failure}")
+    sys.exit(1 if failures else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+"""
+End-to-end performance suite for the Sentinel hot paths.
+Streams synthetic True/Fake archives (src.data_generator) at each requested size, then times
+clean_text, prepare_data, train, predict, get_local_explanation,
+get_related_intel, get_linguistic_audit and history persistence. Each size
+runs in a fresh interpreter, and on Linux the kernel's RSS high-water mark
+is reset before every stage, so each stage reports its own peak and the
+memory it added (rss_delta_mb). Results (throughput, p50/p95/p99 latency,
+RSS) go to a JSON baseline; --compare flags regressions against an earlier one.
+
+    python -m benchmarks.bench_suite --sizes 10k,100k --save benchmarks/baseline.json
+    python -m benchmarks.bench_suite --sizes 10k,100k --compare benchmarks/baseline.json
+    python -m benchmarks.bench_suite --sizes 1M --samples 500 --save benchmarks/baseline-1m.json
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import numpy as np
+
+STAGES = (
+    "clean_text", "prepare_data", "train", "predict", "predict_batch",
+    "get_local_explanation", "index_build", "get_related_intel",
+    "get_linguistic_audit", "audit_batch", "history_add", "history_recent",
+)
+
+# RSS growth below this is noise (allocator arenas, page cache) and never flagged
+RSS_FLOOR_MB = 8.0
+
+def peak_rss_mb():
+    # Process-lifetime peak; ru_maxrss is KiB on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def _proc_status_mb(field):
+    try:
+        with open("/proc/self/status", "r") as f:
+            for line in f:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1]) / 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+def _reset_peak_rss():
+    # Linux >= 4.0: writing 5 to clear_refs restarts VmHWM from the current RSS
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return _proc_status_mb("VmHWM") is not None
+    except OSError:
+        return False
+
+class RssWindow:
+    """
+    Memory seen by one stage. Where the high-water mark can be reset the peak
+    is the stage's own; elsewhere it stays process-wide and the delta is how
+    far the stage pushed that peak up.
+    """
+    def __init__(self):
+        self.scoped = _reset_peak_rss()
+        self.start = _proc_status_mb("VmRSS") if self.scoped else peak_rss_mb()
+
+    def summary(self):
+        peak = _proc_status_mb("VmHWM") if self.scoped else peak_rss_mb()
+        return {
+            "peak_rss_mb": round(peak, 1),
+            "rss_delta_mb": round(max(0.0, peak - self.start), 1),
+            "rss_scope": "stage" if self.scoped else "process",
+        }
+
+def summarize(latencies_s, items=None, elapsed_s=None, memory=None):
+    lat = np.asarray(latencies_s) * 1000
+    items = len(lat) if items is None else items
+    elapsed_s = float(np.sum(latencies_s)) if elapsed_s is None else elapsed_s
+    return {
+        "items": int(items),
+        "seconds": round(elapsed_s, 4),
+        "throughput": round(items / elapsed_s, 2) if elapsed_s > 0 else None,
+        "p50_ms": round(float(np.percentile(lat, 50)), 4),
+        "p95_ms": round(float(np.percentile(lat, 95)), 4),
+        "p99_ms": round(float(np.percentile(lat, 99)), 4),
+        **(memory or RssWindow()).summary(),
+    }
+
+def timed_each(fn, items):
+    memory = RssWindow()
+    latencies = []
+    for item in items:
+        start = time.perf_counter()
+        fn(item)
+        latencies.append(time.perf_counter() - start)
+    return summarize(latencies, memory=memory)
+
+def timed_once(fn, items):
+    memory = RssWindow()
+    start = time.perf_counter()
+    result = fn()
+    return result, summarize([time.perf_counter() - start], items=items, memory=memory)
+
+def run_size(n_docs, samples, workers, seed):
+    """
+    Runs every stage for one corpus size inside the current process.
+    """
+    from src.training import AetherNeuralEngine
+    from src.explain import AetherForensicExplainer
+    from src.index import AetherSimilarityIndex
+    from src.corpus_cache import AetherCorpusCache
+    from src.history import AetherHistoryStore
+    from src.data_generator import AetherSyntheticNewsGenerator, write_archives
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="aether-bench-") as work:
+        true_csv, fake_csv = write_archives(work, n_docs, generator=AetherSyntheticNewsGenerator(seed=seed))
+        engine = AetherNeuralEngine(os.path.join(work, "model.pkl"), os.path.join(work, "vectorizer.pkl"))
+        archive = AetherCorpusCache((true_csv, fake_csv), cache_dir=os.path.join(work, "cache")).load_archive()
+        rng = np.random.default_rng(seed)
+        sample = archive['total_text'].iloc[rng.choice(len(archive), size=min(samples, len(archive)), replace=False)].tolist()
+
+        # Fresh lemma cache per size so clean_text is measured cold, as on first contact
+        results["clean_text"] = timed_each(engine.preprocessor.clean_text, sample)
+        df, results["prepare_data"] = timed_once(
+            lambda: engine.prepare_data(true_csv, fake_csv, n_jobs=workers, use_cache=False), len(archive)
+        )
+        _, results["train"] = timed_once(lambda: engine.train(df), len(df))
+        results["predict"] = timed_each(engine.predict, sample)
+        _, results["predict_batch"] = timed_once(lambda: engine.predict_many(sample), len(sample))
+
+        explainer = AetherForensicExplainer(engine.model, engine.vectorizer)
+        results["get_local_explanation"] = timed_each(lambda t: explainer.get_local_explanation([t]), sample[:200])
+
+        index = AetherSimilarityIndex(engine.vectorizer, sources=((true_csv, 1), (fake_csv, 0)), index_dir=os.path.join(work, "index"))
+        _, results["index_build"] = timed_once(index.refresh, len(archive))
+        explainer.related_index = index
+        results["get_related_intel"] = timed_each(lambda t: explainer.get_related_intel(t, archive), sample[:200])
+
+        results["get_linguistic_audit"] = timed_each(explainer.get_linguistic_audit, sample)
+        _, results["audit_batch"] = timed_once(lambda: explainer.get_linguistic_audit_batch(archive['total_text']), len(archive))
+
+        store = AetherHistoryStore(os.path.join(work, "history.db"), legacy_json=os.path.join(work, "history.json"))
+        entries = [
+            {"id": f"bench-{i}", "timestamp": "2026-01-01T00:00:00", "text": t[:100] + "...", "score": 0.9, "label": "AUTHENTIC"}
+            for i, t in enumerate(sample)
+        ]
+        results["history_add"] = timed_each(store.add, entries)
+        results["history_recent"] = timed_each(lambda _: store.recent(hours=24 * 365 * 100), range(50))
+    return results
+
+def parse_size(label):
+    label = label.strip().lower()
+    scale = {"k": 1_000, "m": 1_000_000}.get(label[-1], 1)
+    return int(float(label.rstrip("km")) * scale)
+
+def compare(current, baseline, tolerance):
+    """
+    Flags stages whose throughput fell, or whose p95 latency / RSS growth rose,
+    by more than tolerance relative to the baseline. Memory is judged on the
+    stage's own rss_delta_mb (and its peak only when both runs scoped it to
+    the stage), never on a process-wide peak inherited from an earlier stage.
+    """
+    failures = []
+    for size, stages in current["results"].items():
+        for stage, now in stages.items():
+            ref = baseline.get("results", {}).get(size, {}).get(stage)
+            if not ref:
+                continue
+            if ref.get("throughput") and now.get("throughput") and now["throughput"] < ref["throughput"] * (1 - tolerance):
+                failures.append(f"{size}/{stage}: throughput {now['throughput']:.1f}/s vs {ref['throughput']:.1f}/s")
+            if ref.get("p95_ms") and now["p95_ms"] > ref["p95_ms"] * (1 + tolerance):
+                failures.append(f"{size}/{stage}: p95_ms {now['p95_ms']} vs {ref['p95_ms']}")
+            memory_keys = ["rss_delta_mb"]
+            if ref.get("rss_scope") == now.get("rss_scope") == "stage":
+                memory_keys.append("peak_rss_mb")
+            for key in memory_keys:
+                if key in ref and key in now and now[key] > ref[key] + max(ref[key] * tolerance, RSS_FLOOR_MB):
+                    failures.append(f"{size}/{stage}: {key} {now[key]} vs {ref[key]}")
+    return failures
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="10k,100k", help="Comma-separated corpus sizes, e.g. 10k,100k,1M.")
+    parser.add_argument("--samples", type=int, default=1000, help="Documents timed per-call for latency percentiles.")
+    parser.add_argument("--workers", type=int, default=1, help="Cleaning processes for prepare_data (-1 = all cores).")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--save", help="Write results to this JSON baseline.")
+    parser.add_argument("--compare", help="Baseline JSON to check for regressions.")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed relative regression.")
+    parser.add_argument("--single", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single:
+        # Child mode: one size, results as JSON on the last stdout line
+        results = run_size(parse_size(args.single), args.samples, args.workers, args.seed)
+        print(json.dumps(results))
+        return
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "samples": args.samples,
+            "workers": args.workers,
+            "seed": args.seed,
+        },
+        "results": {},
+    }
+    for label in args.sizes.split(","):
+        label = label.strip()
+        print(f"[BENCH] Corpus {label} ({parse_size(label):,} docs)...")
+        proc = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_suite", "--single", label,
+             "--samples", str(args.samples), "--workers", str(args.workers), "--seed", str(args.seed)],
+            capture_output=True, text=True
+        )
+        if proc.returncode != 0:
+            sys.stderr.write(proc.stderr)
+            sys.exit(proc.returncode)
+        results = json.loads(proc.stdout.strip().splitlines()[-1])
+        report["results"][label] = results
+        for stage in STAGES:
+            r = results[stage]
+            print(f"  {stage:<22} {r['throughput'] or 0:>12,.1f}/s  p50 {r['p50_ms']:>9.3f}ms  "
+                  f"p95 {r['p95_ms']:>9.3f}ms  p99 {r['p99_ms']:>9.3f}ms  "
+                  f"rss {r['peak_rss_mb']:>8.1f}MB (+{r['rss_delta_mb']:.1f})")
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"[BENCH] Baseline written to {args.save}")
+
+    failures = []
+    if args.compare:
+        with open(args.compare, "r") as f:
+            failures = compare(report, json.load(f), args.tolerance)
+    for failure in failures:
+        print(f"[REGRESSION] {failure}")
+    sys.exit(1 if failures else 0)
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,3 @@
-import joblib
-model = joblib.load('models/model.pkl')
-print(f"Classes: {model.classes_}")
+import joblib
+model = joblib.load('models/model.pkl')
+print(f"Classes: {model.classes_}")
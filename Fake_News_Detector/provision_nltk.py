@@ -0,0 +1,33 @@
+from src.nltk_assets import NLTK_DATA_DIR, provision, verify
+import argparse
+import sys
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Vault the NLTK corpora the Aether Sentinel needs.")
+    parser.add_argument("--source", default=None,
+                        help="Existing nltk_data tree to copy from (air-gapped hosts). Downloads otherwise.")
+    parser.add_argument("--data-dir", default=NLTK_DATA_DIR,
+                        help="Project-local vault read at runtime.")
+    parser.add_argument("--verify", action="store_true",
+                        help="Only check the vault against its manifest.")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    if not args.verify:
+        print(f"[+] PROVISIONING NLTK VAULT AT {args.data_dir}...")
+        try:
+            provision(args.data_dir, source_dir=args.source)
+        except (OSError, RuntimeError) as e:
+            print(f"[!] {e}")
+            sys.exit(1)
+
+    problems = verify(args.data_dir)
+    for problem in problems:
+        print(f"[!] {problem}")
+    if problems:
+        sys.exit(1)
+    print("[+] VAULT INTEGRITY VERIFIED.")
+
+if __name__ == "__main__":
+    main()
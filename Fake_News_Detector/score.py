@@ -0,0 +1,37 @@
+from src.scoring import AetherBatchScorer, OUTPUT_FORMATS
+import argparse
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Aether Neural Sentinel bulk scoring for CSV/JSONL dumps.")
+    parser.add_argument("inputs", nargs="+",
+                        help="CSV / JSONL files (optionally .gz) or directories to scan recursively.")
+    parser.add_argument("-o", "--output", required=True,
+                        help="Result file (.csv / .jsonl) or Parquet directory (.parquet).")
+    parser.add_argument("--format", choices=OUTPUT_FORMATS, default=None,
+                        help="Output format (default: from the output extension).")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Processes used for text cleaning (-1 = all cores).")
+    parser.add_argument("--chunksize", type=int, default=5000,
+                        help="Documents read, scored and written per batch.")
+    parser.add_argument("--text-column", default=None,
+                        help="Column holding the article (default: title + text, else text/content/body).")
+    parser.add_argument("--id-column", default=None,
+                        help="Column copied through to the results as 'id'.")
+    parser.add_argument("--audit", action="store_true",
+                        help="Add the linguistic audit (assessment and stat densities).")
+    parser.add_argument("--related", type=int, default=0, choices=range(0, 6), metavar="K",
+                        help="Add the top K (<= 5) related archive articles as JSON.")
+    parser.add_argument("--resume", action="store_true",
+                        help="Continue an interrupted run from its .progress.json checkpoint.")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    scorer = AetherBatchScorer(
+        n_jobs=args.workers, chunksize=args.chunksize, text_column=args.text_column,
+        id_column=args.id_column, audit=args.audit, related=args.related
+    )
+    scorer.run(args.inputs, args.output, fmt=args.format, resume=args.resume)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+from src.service import AetherInferenceService
+import argparse
+import asyncio
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Aether Neural Sentinel HTTP inference service.")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind.")
+    parser.add_argument("--port", type=int, default=8000, help="Port to bind.")
+    parser.add_argument("--max-batch-size", type=int, default=64,
+                        help="Most texts scored in one vectorize + predict_proba call.")
+    parser.add_argument("--max-wait-ms", type=float, default=5.0,
+                        help="How long the first request in a batch waits for company.")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    service = AetherInferenceService(
+        host=args.host, port=args.port,
+        max_batch_size=args.max_batch_size, max_wait_ms=args.max_wait_ms
+    )
+    try:
+        asyncio.run(service.serve_forever())
+    except KeyboardInterrupt:
+        print("\n[SERVICE] Sentinel offline.")
+
+if __name__ == "__main__":
+    main()
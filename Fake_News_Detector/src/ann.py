@@ -0,0 +1,103 @@
+import numpy as np
+
+def _top_k(scores, k):
+    k = min(k, scores.shape[0])
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+    top = np.argpartition(-scores, k - 1)[:k]
+    return top[np.argsort(-scores[top], kind='stable')]
+
+class AetherExactSearch:
+    """
+    Exact cosine search: one sparse mat-vec over every archived vector.
+    Rows are expected to be L2-normalized, so the dot product is the cosine.
+    """
+    def fit(self, matrix):
+        self.matrix = matrix.tocsr()
+        return self
+
+    def search(self, query_vec, k=5):
+        scores = np.asarray((self.matrix @ query_vec.T).todense()).ravel()
+        top = _top_k(scores, k)
+        return top, scores[top]
+
+class AetherLSHSearch:
+    """
+    Approximate cosine search via random-projection (SimHash) LSH.
+    Each of n_tables hashes a vector to the sign pattern of n_bits Gaussian
+    projections. A query probes its own bucket plus the n_probes neighbouring
+    buckets whose bits were closest to flipping, then re-ranks the candidate
+    pool exactly. More tables/probes raise recall, fewer bits widen buckets;
+    both trade latency for recall. Too few candidates falls back to exact search.
+    """
+    def __init__(self, n_tables=16, n_bits=14, n_probes=4, seed=42, exact_fallback=True, chunk_size=65536):
+        if not 1 <= n_bits <= 63:
+            raise ValueError("n_bits must be between 1 and 63")
+        self.n_tables = n_tables
+        self.n_bits = n_bits
+        self.n_probes = n_probes
+        self.seed = seed
+        self.exact_fallback = exact_fallback
+        self.chunk_size = chunk_size
+        self._weights = np.left_shift(np.uint64(1), np.arange(n_bits, dtype=np.uint64))
+
+    def _project(self, matrix):
+        return np.asarray(matrix @ self.planes, dtype=np.float32).reshape(-1, self.n_tables, self.n_bits)
+
+    def _codes(self, projections):
+        return ((projections > 0).astype(np.uint64) * self._weights).sum(axis=2, dtype=np.uint64)
+
+    def fit(self, matrix):
+        self.matrix = matrix.tocsr()
+        rng = np.random.default_rng(self.seed)
+        self.planes = rng.standard_normal((self.matrix.shape[1], self.n_tables * self.n_bits)).astype(np.float32)
+
+        codes = np.empty((self.matrix.shape[0], self.n_tables), dtype=np.uint64)
+        for start in range(0, self.matrix.shape[0], self.chunk_size):
+            stop = start + self.chunk_size
+            codes[start:stop] = self._codes(self._project(self.matrix[start:stop]))
+
+        # Sorted code columns turn bucket lookup into two binary searches
+        self._order = np.argsort(codes, axis=0, kind='stable')
+        self._sorted = np.take_along_axis(codes, self._order, axis=0)
+        self._exact = AetherExactSearch().fit(self.matrix)
+        return self
+
+    def _candidates(self, query_vec):
+        projections = self._project(query_vec)[0]
+        codes = self._codes(projections[None])[0]
+        pools = []
+        for t in range(self.n_tables):
+            probes = [codes[t]]
+            if self.n_probes:
+                # Query-directed probing: flip the least confident bits first
+                for bit in np.argsort(np.abs(projections[t]))[:self.n_probes]:
+                    probes.append(codes[t] ^ self._weights[bit])
+            column = self._sorted[:, t]
+            for code in probes:
+                lo = np.searchsorted(column, code, side='left')
+                hi = np.searchsorted(column, code, side='right')
+                if hi > lo:
+                    pools.append(self._order[lo:hi, t])
+        if not pools:
+            return np.empty(0, dtype=np.int64)
+        return np.unique(np.concatenate(pools))
+
+    def search(self, query_vec, k=5):
+        candidates = self._candidates(query_vec)
+        if len(candidates) < k and self.exact_fallback:
+            return self._exact.search(query_vec, k)
+        scores = np.asarray((self.matrix[candidates] @ query_vec.T).todense()).ravel()
+        top = _top_k(scores, k)
+        return candidates[top], scores[top]
+
+SEARCH_BACKENDS = {"exact": AetherExactSearch, "lsh": AetherLSHSearch}
+
+def make_search_backend(name):
+    """
+    Builds a related-search backend by name ('exact' or 'lsh').
+    """
+    try:
+        return SEARCH_BACKENDS[name.strip().lower()]()
+    except KeyError:
+        raise ValueError(f"Unknown search backend '{name}' (choose from {', '.join(SEARCH_BACKENDS)})") from None
@@ -0,0 +1,49 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+class AetherExplanationPool:
+    """
+    Process-wide background pool for SHAP traces.
+    Explanations run off the request thread and are memoized per
+    (artifact version, text), so repeat scans and concurrent users
+    share one worker pool and one result cache.
+    """
+    def __init__(self, max_workers=2, cache_size=256):
+        self.cache_size = cache_size
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="aether-explain")
+        self._futures = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(text, version=None):
+        digest = hashlib.sha256(f"{version}\x00{text}".encode("utf-8"))
+        return digest.hexdigest()
+
+    def submit(self, explainer, text, version=None):
+        """
+        Schedules (or reuses) an explanation for text and returns its cache key.
+        """
+        key = self.make_key(text, version)
+        with self._lock:
+            future = self._futures.get(key)
+            if future is not None and not (future.done() and future.result() is None):
+                self._futures.move_to_end(key)
+                return key
+            self._futures[key] = self._executor.submit(explainer.get_local_explanation, [text])
+            while len(self._futures) > self.cache_size:
+                self._futures.popitem(last=False)
+        return key
+
+    def poll(self, key):
+        """
+        Returns (done, explanation). Unknown or evicted keys report (True, None).
+        """
+        with self._lock:
+            future = self._futures.get(key)
+        if future is None:
+            return True, None
+        if not future.done():
+            return False, None
+        return True, future.result()
@@ -0,0 +1,124 @@
+import numpy as np
+
+# Single source of truth for the linguistic audit; the scalar and batch paths both read these
+AUDIT_THRESHOLDS = {
+    "sensationalism": 15.0,  # ALL-CAPS words per 100 words
+    "urgency": 5.0,          # exclamation marks per 100 words
+    "speculation": 4.0,      # question marks per 100 words
+    "min_words": 35,         # shorter articles are flagged as low substance
+}
+ASSESSMENTS = ("Standard", "Caution Advised", "Highly Suspicious")
+AUDIT_FLAGS = ("high_sensationalism", "urgency_markers", "speculative_tone", "low_substance")
+
+# ASCII byte classes: 0 = whitespace (exactly str.isspace), 8 = other, 9 = lowercase, 10 = uppercase
+_BYTE_CLASS = bytearray([8]) * 256
+for _b in (9, 10, 11, 12, 13, 28, 29, 30, 31, 32):
+    _BYTE_CLASS[_b] = 0
+for _b in range(ord('a'), ord('z') + 1):
+    _BYTE_CLASS[_b] = 9
+for _b in range(ord('A'), ord('Z') + 1):
+    _BYTE_CLASS[_b] = 10
+_BYTE_CLASS = bytes(_BYTE_CLASS)
+
+def assess(n_flags):
+    """
+    Maps a count of raised audit flags to the forensic assessment label.
+    """
+    return ASSESSMENTS[min(n_flags, 2)]
+
+def scalar_counts(text):
+    """
+    Reference counts for one text: (words, ALL-CAPS words, '!' marks, '?' marks).
+    """
+    words = text.split()
+    caps_words = sum(1 for w in words if w.isupper() and len(w) > 1)
+    return len(words), caps_words, text.count('!'), text.count('?')
+
+def _ascii_counts(texts):
+    # One byte buffer for the whole block; words are maximal non-whitespace runs
+    lengths = np.fromiter(map(len, texts), dtype=np.int64, count=len(texts)) + 1
+    doc_start = np.cumsum(lengths) - lengths + 1
+    codes = np.frombuffer((" " + "\n".join(texts) + "\n").encode('ascii').translate(_BYTE_CLASS), dtype=np.uint8)
+    nonspace = codes != 0
+    edges = np.flatnonzero(nonspace[1:] != nonspace[:-1]) + 1
+    starts, ends = edges[0::2], edges[1::2]
+
+    # OR of the class codes per word: bit 1 = has lowercase, bit 2 = has uppercase
+    if len(starts):
+        mask = np.bitwise_or.reduceat(codes, starts)
+        caps_word = ((mask & 3) == 2) & (ends - starts > 1)
+    else:
+        caps_word = np.zeros(0, dtype=bool)
+    bounds = np.append(np.searchsorted(starts, doc_start), len(starts))
+    caps_cum = np.concatenate(([0], np.cumsum(caps_word, dtype=np.int64)))
+    words = np.diff(bounds)
+    caps = caps_cum[bounds[1:]] - caps_cum[bounds[:-1]]
+    exclamations = np.fromiter((t.count('!') for t in texts), dtype=np.int64, count=len(texts))
+    questions = np.fromiter((t.count('?') for t in texts), dtype=np.int64, count=len(texts))
+    return words, caps, exclamations, questions
+
+def audit_counts(texts, block_chars=1 << 24):
+    """
+    Vectorized (words, caps_words, exclamations, question_marks) arrays for a column of texts.
+    ASCII texts go through a NumPy byte-class pass in blocks of ~block_chars characters;
+    the rare non-ASCII text falls back to scalar_counts, so counts always match the
+    scalar audit exactly. Non-string entries count as empty.
+    """
+    texts = [t if isinstance(t, str) else "" for t in texts]
+    counts = np.zeros((4, len(texts)), dtype=np.int64)
+    ascii_idx = []
+    for i, text in enumerate(texts):
+        if text.isascii():
+            ascii_idx.append(i)
+        else:
+            counts[:, i] = scalar_counts(text)
+
+    block, block_len = [], 0
+    for i in ascii_idx + [None]:
+        if i is not None:
+            block.append(i)
+            block_len += len(texts[i]) + 1
+        if block and (i is None or block_len >= block_chars):
+            counts[:, block] = _ascii_counts([texts[j] for j in block])
+            block, block_len = [], 0
+    return counts
+
+def linguistic_audit_frame(texts, thresholds=None):
+    """
+    Batch Linguistic Intelligence Agent.
+    Returns one typed row per text with the same stats, flags and assessment
+    as AetherForensicExplainer.get_linguistic_audit. Rows for empty input
+    carry a missing assessment (the scalar path reports an error for them).
+    """
+    import pandas as pd
+    thresholds = thresholds or AUDIT_THRESHOLDS
+    index = texts.index if isinstance(texts, pd.Series) else None
+    texts = [t if isinstance(t, str) else "" for t in texts]
+    words, caps, exclamations, questions = audit_counts(texts)
+
+    denom = words + 1
+    stats = {
+        "sensationalism": (caps / denom) * 100,
+        "urgency": (exclamations / denom) * 100,
+        "speculation": (questions / denom) * 100,
+    }
+    flags = {
+        "high_sensationalism": stats["sensationalism"] > thresholds["sensationalism"],
+        "urgency_markers": stats["urgency"] > thresholds["urgency"],
+        "speculative_tone": stats["speculation"] > thresholds["speculation"],
+        "low_substance": words < thresholds["min_words"],
+    }
+    n_flags = np.sum([flags[f] for f in AUDIT_FLAGS], axis=0) if len(texts) else np.zeros(0, dtype=np.int64)
+    empty = np.fromiter((not t for t in texts), dtype=bool, count=len(texts))
+
+    codes = np.where(empty, -1, np.minimum(n_flags, 2))
+    frame = pd.DataFrame({
+        "word_count": words,
+        "caps_words": caps,
+        "exclamations": exclamations,
+        "question_marks": questions,
+        **{k: v.astype(np.float64) for k, v in stats.items()},
+        **{k: v & ~empty for k, v in flags.items()},
+        "assessment": pd.Categorical.from_codes(codes, categories=list(ASSESSMENTS)),
+    }, index=index)
+    return frame
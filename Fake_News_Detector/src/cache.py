@@ -0,0 +1,136 @@
+import hashlib
+import os
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+def normalize_key_text(text):
+    """
+    Whitespace-insensitive form of a scan input. Cleaning, vectorization and the
+    linguistic audit all tokenize on whitespace, so results are unchanged by it.
+    """
+    return " ".join(str(text).split())
+
+class AetherResultCache:
+    """
+    Content-addressed cache for scan results.
+    Entries are keyed by a SHA-256 of the normalized input text, bounded by
+    an LRU size limit and a TTL, and dropped wholesale whenever the model
+    artifact version changes. Optionally persisted to disk; the file is only
+    an accelerator, so an unreadable or unwritable one is logged and ignored.
+    """
+    def __init__(self, max_size=1024, ttl_seconds=3600, path=None, persist_every=25):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.path = path
+        self.persist_every = persist_every
+        self.version = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+        self._store = OrderedDict()
+        self._dirty = 0
+        self._lock = threading.Lock()
+        if path and os.path.exists(path):
+            self.load(path)
+
+    @staticmethod
+    def make_key(text):
+        return hashlib.sha256(normalize_key_text(text).encode("utf-8")).hexdigest()
+
+    def _sync_version(self, version):
+        if version != self.version:
+            if self._store:
+                self.invalidations += 1
+            self._store.clear()
+            self.version = version
+
+    def get(self, text, version=None):
+        key = self.make_key(text)
+        with self._lock:
+            self._sync_version(version)
+            entry = self._store.get(key)
+            if entry is not None and entry[0] < time.time():
+                del self._store[key]
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._store.move_to_end(key)
+            return entry[1]
+
+    def put(self, text, value, version=None):
+        key = self.make_key(text)
+        with self._lock:
+            self._sync_version(version)
+            self._store[key] = (time.time() + self.ttl_seconds, value)
+            self._store.move_to_end(key)
+            while len(self._store) > self.max_size:
+                self._store.popitem(last=False)
+                self.evictions += 1
+            self._dirty += 1
+            flush = self.path and self._dirty >= self.persist_every
+        if flush:
+            self.save()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._store),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations
+        }
+
+    def save(self, path=None):
+        """
+        Writes the cache to disk. Returns True on success; failures never reach the scan.
+        """
+        path = path or self.path
+        if not path:
+            return False
+        with self._lock:
+            payload = {"version": self.version, "entries": list(self._store.items())}
+            self._dirty = 0
+        tmp_path = f"{path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError) as e:
+            print(f"[WARN] Result cache not saved to {path}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return False
+        return True
+
+    def load(self, path):
+        # Unpickling a truncated or foreign file can raise almost anything
+        # (AttributeError, ImportError, TypeError, ...): start empty instead
+        now = time.time()
+        try:
+            with open(path, "rb") as f:
+                payload = pickle.load(f)
+            version = payload["version"]
+            entries = OrderedDict(
+                (key, entry) for key, entry in payload["entries"][-self.max_size:]
+                if isinstance(key, str) and entry[0] >= now
+            )
+        except Exception as e:
+            print(f"[WARN] Result cache at {path} unreadable ({type(e).__name__}: {e}); starting empty")
+            return
+        with self._lock:
+            self.version = version
+            self._store = entries
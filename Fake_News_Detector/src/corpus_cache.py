@@ -0,0 +1,109 @@
+import hashlib
+import json
+import os
+from src.preprocessing import PREPROCESSING_VERSION
+
+CORPUS_COLUMNS = ['title', 'text', 'total_text', 'target']
+
+class AetherCorpusCache:
+    """
+    Columnar (Parquet) cache of the preprocessed corpus.
+    Keyed by the raw archives' content hashes plus PREPROCESSING_VERSION, so
+    retrains and app startup skip CSV parsing and the NLTK pipeline whenever
+    neither the data nor the cleaning logic has changed. Raw file hashes are
+    memoized against (mtime, size) to keep lookups cheap.
+    """
+    def __init__(self, sources=('data/raw/True.csv', 'data/raw/Fake.csv'), cache_dir='data/cache'):
+        self.sources = tuple(sources)
+        self.cache_dir = cache_dir
+        self.digest_path = os.path.join(cache_dir, 'raw_digests.json')
+
+    def _file_digest(self, path, memo):
+        st = os.stat(path)
+        stamp = [st.st_mtime_ns, st.st_size]
+        entry = memo.get(path)
+        if entry and entry["stamp"] == stamp:
+            return entry["sha256"]
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        memo[path] = {"stamp": stamp, "sha256": digest.hexdigest()}
+        return memo[path]["sha256"]
+
+    def key(self):
+        """
+        Cache key for the current archives, or None if any source is missing.
+        """
+        if not all(os.path.exists(p) for p in self.sources):
+            return None
+        try:
+            with open(self.digest_path, "r") as f:
+                memo = json.load(f)
+        except (OSError, ValueError):
+            memo = {}
+        before = json.dumps(memo, sort_keys=True)
+        digests = [self._file_digest(p, memo) for p in self.sources]
+        if json.dumps(memo, sort_keys=True) != before:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(self.digest_path, "w") as f:
+                json.dump(memo, f, indent=2)
+        combined = hashlib.sha256("\x00".join(digests + [PREPROCESSING_VERSION]).encode())
+        return combined.hexdigest()[:16]
+
+    def path(self, key=None):
+        key = key or self.key()
+        return os.path.join(self.cache_dir, f"corpus-{key}.parquet") if key else None
+
+    def load(self, columns=None):
+        """
+        Returns the cached corpus (optionally a column subset), or None on a miss.
+        """
+        path = self.path()
+        if not path or not os.path.exists(path):
+            return None
+        try:
+            import pandas as pd
+            return pd.read_parquet(path, columns=list(columns) if columns else None)
+        except Exception as e:
+            print(f"[CACHE] Corpus cache unreadable ({e}); ignoring it")
+            return None
+
+    def load_archive(self):
+        """
+        Returns the raw archive (title, text, target, total_text) used for related-article
+        matching: column-pruned from the cache on a hit, parsed from the CSVs otherwise.
+        Sources are labelled in order (authentic first, fabricated second).
+        """
+        if not all(os.path.exists(p) for p in self.sources):
+            return None
+        import pandas as pd
+        df = self.load(columns=['title', 'text', 'target'])
+        if df is None:
+            frames = []
+            for source, target in zip(self.sources, (1, 0)):
+                frame = pd.read_csv(source)
+                frame['target'] = target
+                frames.append(frame)
+            df = pd.concat(frames).reset_index(drop=True)
+        df['total_text'] = df['title'].fillna('') + " " + df['text'].fillna('')
+        return df
+
+    def save(self, df):
+        key = self.key()
+        if not key:
+            return None
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self.path(key)
+        tmp_path = f"{path}.tmp"
+        try:
+            df[CORPUS_COLUMNS].to_parquet(tmp_path, index=False)
+        except ImportError as e:
+            print(f"[CACHE] Parquet engine unavailable ({e}); corpus cache disabled")
+            return None
+        os.replace(tmp_path, path)
+        # Older keys are dead weight once the archives or cleaning logic moved on
+        for name in os.listdir(self.cache_dir):
+            if name.startswith("corpus-") and name.endswith(".parquet") and name != os.path.basename(path):
+                os.remove(os.path.join(self.cache_dir, name))
+        return path
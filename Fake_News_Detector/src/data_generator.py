@@ -1,24 +1,279 @@
-import pandas as pd
-import os
-
-def create_sample_data():
-    os.makedirs('data/raw', exist_ok=True)
-    
-    true_news = [
-        {"title": "Global Climate Accord Reached", "text": "Leaders from 190 countries signed a historic agreement to reduce carbon emissions by 50% by 2030, citing Reuters reports.", "subject": "worldnews", "date": "2024-01-01"},
-        {"title": "New Tech Breakthrough in Solar Energy", "text": "Researchers at MIT have developed a new solar cell that is 40% more efficient than current technologies, as reported by AP.", "subject": "tech", "date": "2024-01-02"},
-        {"title": "Economic Growth Exceeds Expectations", "text": "The latest GDP figures show a 3.5% growth rate, outpacing analyst predictions of 2.8%, according to official Washington statistics.", "subject": "politics", "date": "2024-01-03"}
-    ] * 50 # Duplicate to have enough for a tiny training set
-    
-    fake_news = [
-        {"title": "Alien Invasion Imminent Says Top Secret Source", "text": "A leaked document from a secret underground base claims that aliens are planning to invade Earth next Tuesday. Share before it's deleted!", "subject": "conspiracy", "date": "2024-01-01"},
-        {"title": "Magic Pill Cures All Diseases Instantly", "text": "Big Pharma is hiding the truth about a $1 pill that can cure anything from the common cold to cancer. Doctors hate this one trick!", "subject": "health", "date": "2024-01-02"},
-        {"title": "Celebrity Replaced by Clone, Evidence Found", "text": "Fans noticed a change in the star's earlobe shape, proving they have been replaced by a government-funded biological clone.", "subject": "gossip", "date": "2024-01-03"}
-    ] * 50
-    
-    pd.DataFrame(true_news).to_csv('data/raw/True.csv', index=False)
-    pd.DataFrame(fake_news).to_csv('data/raw/Fake.csv', index=False)
-    print("Sample data generated in data/raw/")
-
-if __name__ == "__main__":
-    create_sample_data()
+import argparse
+import os
+import numpy as np
+import pandas as pd
+
+# Templated vocabularies: topic-specific terms plus shared newsroom filler
+TOPICS = {
+    "politicsNews": {
+        "entities": "Senate Congress White_House Parliament Supreme_Court Governor Pentagon Treasury".split(),
+        "terms": "bill vote committee election campaign policy minister lawmakers reform hearing veto coalition ballot".split(),
+    },
+    "worldnews": {
+        "entities": "Brussels Beijing Moscow Kyiv Tehran Brasilia Nairobi Jakarta United_Nations NATO".split(),
+        "terms": "summit talks ceasefire embassy sanctions refugees treaty alliance protest border diplomats troops".split(),
+    },
+    "business": {
+        "entities": "Federal_Reserve Wall_Street OPEC IMF Nasdaq European_Central_Bank".split(),
+        "terms": "market inflation rates growth trade tariff jobs earnings investors budget deficit shares exports".split(),
+    },
+    "science": {
+        "entities": "NASA WHO CDC MIT Oxford CERN".split(),
+        "terms": "researchers study climate energy vaccine trial data satellite laboratory species ocean emissions".split(),
+    },
+    "technology": {
+        "entities": "Google Apple Microsoft Samsung Nvidia OpenAI".split(),
+        "terms": "software chip startup platform privacy network users device security cloud regulators antitrust".split(),
+    },
+}
+FILLER = (
+    "the a of to in and on for with after before said reported according while as officials "
+    "on Tuesday last week this year new report government people statement data percent"
+).split()
+ATTRIBUTIONS = [
+    "Reuters reported.", "according to the Associated Press.", "officials said in a statement.",
+    "a spokesperson confirmed.", "data released on Tuesday showed.",
+]
+HOOKS = [
+    "SHOCKING", "BREAKING", "EXPOSED", "You won't believe this", "They don't want you to know",
+    "Share before it's deleted", "The media is hiding this",
+]
+TRUE_SUBJECTS = list(TOPICS)
+FAKE_SUBJECTS = ["News", "politics", "left-news", "Government News", "US_News", "Middle-east"]
+
+class AetherSyntheticNewsGenerator:
+    """
+    Seeded, streaming generator of synthetic news archives for load testing.
+    Articles are built from templated topic vocabularies (Zipf-weighted) with
+    log-normal lengths; fabricated ones carry tunable style markers (ALL-CAPS
+    words, exclamations, questions, clickbait hooks) and authentic ones carry
+    source attributions. style_noise leaks markers across classes so the task
+    is not trivially separable.
+
+    Documents are generated in fixed blocks seeded by (seed, block number),
+    so a given seed yields the same corpus whatever chunk size is requested,
+    and memory stays bounded by the chunk size.
+    """
+    BLOCK_SIZE = 1024
+
+    def __init__(self, seed=42, fake_ratio=0.5, mean_words=250, length_sigma=0.6,
+                 min_words=20, max_words=2000, caps_rate=0.06, exclaim_rate=0.35,
+                 question_rate=0.15, hook_rate=0.6, style_noise=0.05, topic_share=0.45,
+                 sentence_words=18, start_date='2016-01-01', end_date='2018-01-01'):
+        if not 0.0 <= fake_ratio <= 1.0:
+            raise ValueError("fake_ratio must be within [0, 1]")
+        self.seed = seed
+        self.fake_ratio = fake_ratio
+        self.length_mu = np.log(mean_words) - length_sigma ** 2 / 2
+        self.length_sigma = length_sigma
+        self.min_words = min_words
+        self.max_words = max_words
+        self.caps_rate = caps_rate
+        self.exclaim_rate = exclaim_rate
+        self.question_rate = question_rate
+        self.hook_rate = hook_rate
+        self.style_noise = style_noise
+        self.topic_share = topic_share
+        self.sentence_words = sentence_words
+        self.start = np.datetime64(start_date, 'D')
+        self.n_days = int((np.datetime64(end_date, 'D') - self.start).astype(int))
+
+        # Global vocabulary: filler first, then each topic's entities + terms
+        self.vocab = np.array([w.replace('_', ' ') for w in FILLER] + [
+            w.replace('_', ' ') for t in TOPICS.values() for w in t["entities"] + t["terms"]
+        ], dtype=object)
+        self.vocab_upper = np.array([w.upper() for w in self.vocab], dtype=object)
+        self.vocab_title = np.array([w if w[0].isupper() else w.capitalize() for w in self.vocab], dtype=object)
+        self.topic_slices = []
+        offset = len(FILLER)
+        for t in TOPICS.values():
+            size = len(t["entities"]) + len(t["terms"])
+            self.topic_slices.append((offset, size))
+            offset += size
+        self.topic_sizes = np.array([size for _, size in self.topic_slices])
+        self.topic_offsets = np.array([start for start, _ in self.topic_slices])
+
+    def _zipf_index(self, rng, sizes):
+        # Zipf-like rank within each word's own vocabulary slice
+        u = rng.random(len(sizes))
+        return np.minimum((sizes * u ** 2.2).astype(np.int64), sizes - 1)
+
+    def generate_block(self, block, n_docs):
+        """
+        Builds one block of n_docs articles as a DataFrame (title, text, subject, date, target).
+        """
+        rng = np.random.default_rng([self.seed, block])
+        fake = rng.random(n_docs) < self.fake_ratio
+        # Markers normally follow the class; style_noise flips them for a few articles
+        styled = fake ^ (rng.random(n_docs) < self.style_noise)
+        topic = rng.integers(0, len(TOPICS), size=n_docs)
+        mu = np.where(fake, self.length_mu - 0.3, self.length_mu)
+        lengths = np.clip(rng.lognormal(mu, self.length_sigma), self.min_words, self.max_words).astype(np.int64)
+
+        # Word level: topic vs filler draw, Zipf rank, optional ALL-CAPS
+        doc = np.repeat(np.arange(n_docs), lengths)
+        total = len(doc)
+        on_topic = rng.random(total) < self.topic_share
+        word_topic = topic[doc]
+        ids = np.where(
+            on_topic,
+            self.topic_offsets[word_topic] + self._zipf_index(rng, self.topic_sizes[word_topic]),
+            self._zipf_index(rng, np.full(total, len(FILLER)))
+        )
+        caps = styled[doc] & (rng.random(total) < self.caps_rate)
+        tokens = np.where(caps, self.vocab_upper[ids], self.vocab[ids])
+
+        # Sentence ends: '.' normally; styled articles shout and speculate
+        ends = rng.random(total) < 1.0 / self.sentence_words
+        ends[np.cumsum(lengths) - 1] = True
+        marks = rng.random(total)
+        punct = np.where(
+            styled[doc] & (marks < self.exclaim_rate), "!",
+            np.where(styled[doc] & (marks < self.exclaim_rate + self.question_rate), "?", ".")
+        )
+        tokens = np.where(ends, tokens + np.where(ends, punct, ""), tokens).tolist()
+
+        hooks = rng.integers(0, len(HOOKS), size=n_docs)
+        attributions = rng.integers(0, len(ATTRIBUTIONS), size=n_docs)
+        use_hook = styled & (rng.random(n_docs) < self.hook_rate)
+        bangs = rng.integers(1, 4, size=n_docs)
+        title_ids = self.topic_offsets[topic][:, None] + rng.integers(0, self.topic_sizes[topic][:, None], size=(n_docs, 7))
+        days = rng.integers(0, max(self.n_days, 1), size=n_docs)
+        subjects = np.where(fake, rng.integers(0, len(FAKE_SUBJECTS), size=n_docs), topic)
+
+        titles, texts = [], []
+        bounds = np.concatenate(([0], np.cumsum(lengths)))
+        for i in range(n_docs):
+            body = " ".join(tokens[bounds[i]:bounds[i + 1]])
+            title = " ".join(self.vocab_title[title_ids[i]])
+            if use_hook[i]:
+                body = f"{HOOKS[hooks[i]]}! {body}"
+                title = f"{HOOKS[hooks[i]].upper()}: {title}{'!' * bangs[i]}"
+            elif not styled[i]:
+                body = f"{body} {ATTRIBUTIONS[attributions[i]]}"
+            titles.append(title)
+            texts.append(body)
+
+        return pd.DataFrame({
+            "title": titles,
+            "text": texts,
+            "subject": [FAKE_SUBJECTS[s] if f else TRUE_SUBJECTS[s] for s, f in zip(subjects, fake)],
+            "date": (self.start + days).astype(str),
+            "target": (~fake).astype(np.int64),
+        })
+
+    def iter_chunks(self, n_docs, chunksize=50000):
+        """
+        Yields the corpus as DataFrames of up to chunksize rows.
+        """
+        buffer, buffered = [], 0
+        for block, start in enumerate(range(0, n_docs, self.BLOCK_SIZE)):
+            frame = self.generate_block(block, min(self.BLOCK_SIZE, n_docs - start))
+            buffer.append(frame)
+            buffered += len(frame)
+            while buffered >= chunksize:
+                merged = pd.concat(buffer, ignore_index=True)
+                yield merged.iloc[:chunksize].reset_index(drop=True)
+                rest = merged.iloc[chunksize:]
+                buffer, buffered = ([rest] if len(rest) else []), len(rest)
+        if buffered:
+            yield pd.concat(buffer, ignore_index=True)
+
+class AetherChunkWriter:
+    """
+    Appends DataFrame chunks to one CSV or Parquet file with constant memory.
+    """
+    def __init__(self, path, fmt=None):
+        self.path = path
+        self.fmt = fmt or ('parquet' if path.endswith('.parquet') else 'csv')
+        self.rows = 0
+        self._parquet = None
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        if os.path.exists(path):
+            os.remove(path)
+
+    def write(self, df):
+        if self.fmt == 'parquet':
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if self._parquet is None:
+                self._parquet = pq.ParquetWriter(self.path, table.schema)
+            self._parquet.write_table(table)
+        else:
+            df.to_csv(self.path, mode='a', header=self.rows == 0, index=False)
+        self.rows += len(df)
+
+    def close(self):
+        if self._parquet is not None:
+            self._parquet.close()
+            self._parquet = None
+
+def write_corpus(path, n_docs, fmt=None, chunksize=50000, generator=None):
+    """
+    Streams n_docs labelled articles (with a target column) into a single file.
+    """
+    generator = generator or AetherSyntheticNewsGenerator()
+    writer = AetherChunkWriter(path, fmt)
+    try:
+        for chunk in generator.iter_chunks(n_docs, chunksize):
+            writer.write(chunk)
+    finally:
+        writer.close()
+    return writer.rows
+
+def write_archives(out_dir, n_docs, fmt='csv', chunksize=50000, generator=None):
+    """
+    Streams n_docs articles into the Kaggle-style True/Fake archive pair
+    (no target column) that train.py and the related-article index read.
+    """
+    generator = generator or AetherSyntheticNewsGenerator()
+    ext = 'parquet' if fmt == 'parquet' else 'csv'
+    paths = (os.path.join(out_dir, f"True.{ext}"), os.path.join(out_dir, f"Fake.{ext}"))
+    writers = [AetherChunkWriter(p, fmt) for p in paths]
+    try:
+        for chunk in generator.iter_chunks(n_docs, chunksize):
+            for writer, label in zip(writers, (1, 0)):
+                part = chunk[chunk['target'] == label].drop(columns='target')
+                if len(part):
+                    writer.write(part)
+    finally:
+        for writer in writers:
+            writer.close()
+    print(f"[DATA_GEN] {writers[0].rows} authentic / {writers[1].rows} fabricated records -> {out_dir}")
+    return paths
+
+def create_sample_data(n_docs=300, seed=42):
+    write_archives('data/raw', n_docs, generator=AetherSyntheticNewsGenerator(seed=seed))
+    print("Sample data generated in data/raw/")
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Aether synthetic news archive generator.")
+    parser.add_argument("--docs", type=int, default=300, help="Number of articles to generate.")
+    parser.add_argument("--out", default="data/raw", help="Output directory (True/Fake pair) or file with --single-file.")
+    parser.add_argument("--format", choices=("csv", "parquet"), default="csv")
+    parser.add_argument("--single-file", action="store_true",
+                        help="Write one labelled file (with target) instead of the True/Fake pair.")
+    parser.add_argument("--chunksize", type=int, default=50000, help="Rows generated and written per chunk.")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--fake-ratio", type=float, default=0.5)
+    parser.add_argument("--mean-words", type=int, default=250)
+    parser.add_argument("--caps-rate", type=float, default=0.06, help="Share of ALL-CAPS words in styled articles.")
+    parser.add_argument("--exclaim-rate", type=float, default=0.35, help="Share of styled sentences ending in '!'.")
+    parser.add_argument("--question-rate", type=float, default=0.15, help="Share of styled sentences ending in '?'.")
+    parser.add_argument("--style-noise", type=float, default=0.05, help="Share of articles whose style contradicts their label.")
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    args = parse_args()
+    generator = AetherSyntheticNewsGenerator(
+        seed=args.seed, fake_ratio=args.fake_ratio, mean_words=args.mean_words,
+        caps_rate=args.caps_rate, exclaim_rate=args.exclaim_rate,
+        question_rate=args.question_rate, style_noise=args.style_noise
+    )
+    if args.single_file:
+        rows = write_corpus(args.out, args.docs, args.format, args.chunksize, generator)
+        print(f"[DATA_GEN] {rows} records -> {args.out}")
+    else:
+        write_archives(args.out, args.docs, args.format, args.chunksize, generator)
@@ -1,124 +1,219 @@
-import shap
-import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
-import re
-
-class AetherForensicExplainer:
-    """
-    Advanced Forensic Explainer for the Aether Sentinel.
-    Provides SHAP-based feature attribution and linguistic pattern analysis.
-    """
-    def __init__(self, model, vectorizer):
-        self.model = model
-        self.vectorizer = vectorizer
-        # High-precision prediction function for semantic attribution
-        self.predict_fn = lambda x: self.model.predict_proba(self.vectorizer.transform(x))[:, 1]
-        self.explainer = shap.Explainer(self.predict_fn, masker=shap.maskers.Text(tokenizer=r"\W+"))
-
-    def get_local_explanation(self, text_list):
-        """
-        Explains a specific instance of news using SHAP.
-        """
-        try:
-            shap_values = self.explainer(text_list)
-            return shap_values
-        except Exception as e:
-            print(f"[ERROR] SHAP Trace Failure: {e}")
-            return None
-
-    def get_linguistic_audit(self, text):
-        """
-        Aether Linguistic Intelligence Agent.
-        Scans text for syntactic anomalies and emotional triggers.
-        """
-        if not text:
-            return {"status": "error", "report": ["No input provided."]}
-            
-        words = text.split()
-        word_count = len(words)
-        caps_words = [w for w in words if w.isupper() and len(w) > 1]
-        exclamations = text.count('!')
-        question_marks = text.count('?')
-        
-        # Forensic Scoring logic
-        sensationalism_score = (len(caps_words) / (word_count + 1)) * 100
-        urgency_score = (exclamations / (word_count + 1)) * 100
-        speculation_ratio = (question_marks / (word_count + 1)) * 100
-        
-        report = []
-        if sensationalism_score > 15:
-            report.append(f"⚠️ HIGH SENSATIONALISM: {len(caps_words)} words are in ALL CAPS. Pattern matching clickbait signatures.")
-        if urgency_score > 5:
-            report.append(f"🚨 URGENCY MARKERS: High frequency of exclamation marks ({exclamations}). Likely emotional provocation.")
-        if speculation_ratio > 4:
-            report.append("❓ SPECULATIVE TONE: High density of interrogation marks. Suggests unverified inquiry patterns.")
-        if word_count < 35:
-            report.append("📉 LOW SUBSTANCE: Article length below forensic threshold. Legitimate reports typically provide greater context.")
-            
-        final_assessment = "Standard"
-        if len(report) >= 2:
-            final_assessment = "Highly Suspicious"
-        elif len(report) == 1:
-            final_assessment = "Caution Advised"
-            
-        return {
-            "assessment": final_assessment,
-            "report": report if report else ["Linguistic patterns verified within professional benchmarks."],
-            "stats": {
-                "Sensationalism": f"{sensationalism_score:.1f}%",
-                "Urgency": f"{urgency_score:.1f}%",
-                "Speculation": f"{speculation_ratio:.1f}%"
-            }
-        }
-
-    def get_related_intel(self, query_text, dataset_df):
-        """
-        Synchronizes with historic archives to find semantic overlaps.
-        """
-        if not query_text or dataset_df is None:
-            return []
-            
-        from sklearn.metrics.pairwise import cosine_similarity
-        
-        query_vec = self.vectorizer.transform([str(query_text)])
-        sample_size = min(len(dataset_df), 4000) # Increased precision
-        subset = dataset_df.sample(sample_size, random_state=42)
-        
-        dataset_vecs = self.vectorizer.transform(subset['total_text'].astype(str))
-        similarities = cosine_similarity(query_vec, dataset_vecs).flatten()
-        
-        # Extract top forensic matches
-        top_indices = similarities.argsort()[-5:][::-1]
-        
-        results = []
-        for idx in top_indices:
-            score = similarities[idx]
-            if score < 0.08: continue 
-            
-            row = subset.iloc[idx]
-            results.append({
-                "title": str(row['title']).strip(),
-                "content": str(row['text']).strip()[:350] + "...",
-                "similarity": f"{score:.1%}",
-                "status": "Verified" if row['target'] == 1 else "Flagged",
-                "label": "REAL" if row['target'] == 1 else "FAKE"
-            })
-        return results
-
-    def get_global_importance(self):
-        """
-        Extracts global neural weightings for authentic vs anomalous markers.
-        """
-        coefs = self.model.coef_[0]
-        features = self.vectorizer.get_feature_names_out()
-        
-        importance_df = pd.DataFrame({'word': features, 'coefficient': coefs})
-        
-        real_indicators = importance_df.sort_values(by='coefficient', ascending=False).head(25).copy()
-        fake_indicators = importance_df.sort_values(by='coefficient', ascending=True).head(25).copy()
-        
-        real_indicators.columns = ['AUTHENTIC_MARKER', 'WEIGHT']
-        fake_indicators.columns = ['ANOMALY_TRIGGER', 'WEIGHT']
-        
-        return real_indicators, fake_indicators
+import numpy as np
+import re
+from src.audit import AUDIT_THRESHOLDS, assess, linguistic_audit_frame, scalar_counts
+from src.metrics import METRICS
+from src.profiling import PROFILER
+
+class AetherForensicExplainer:
+    """
+    Advanced Forensic Explainer for the Aether Sentinel.
+    Provides SHAP-based feature attribution and linguistic pattern analysis.
+
+    mode='linear' (default) computes exact additive attributions straight from
+    the linear model's weights; mode='shap' runs the permutation explainer.
+    """
+    def __init__(self, model, vectorizer, related_index=None, mode='linear'):
+        self.model = model
+        self.vectorizer = vectorizer
+        # Optional precomputed AetherSimilarityIndex for archive matching
+        self.related_index = related_index
+        self.mode = mode if self._supports_linear() else 'shap'
+        # High-precision prediction function for semantic attribution
+        self.predict_fn = lambda x: self.model.predict_proba(self.vectorizer.transform(x))[:, 1]
+        self._masker = None
+        self._explainer = None
+        self._analyzer = None
+
+    @property
+    def masker(self):
+        # SHAP is heavy to import; defer it until an explanation is actually requested
+        if self._masker is None:
+            import shap
+            self._masker = shap.maskers.Text(tokenizer=r"\W+")
+        return self._masker
+
+    @property
+    def explainer(self):
+        # The permutation explainer is only built when the slow path is requested
+        if self._explainer is None:
+            import shap
+            self._explainer = shap.Explainer(self.predict_fn, masker=self.masker)
+        return self._explainer
+
+    def _supports_linear(self):
+        coef = getattr(self.model, "coef_", None)
+        return (
+            coef is not None and coef.shape[0] == 1
+            and getattr(self.vectorizer, "analyzer", None) == 'word'
+            and tuple(getattr(self.vectorizer, "ngram_range", (0, 0))) == (1, 1)
+        )
+
+    @PROFILER.wrap("get_local_explanation")
+    def get_local_explanation(self, text_list, mode=None):
+        """
+        Explains a specific instance of news using SHAP.
+        """
+        try:
+            with METRICS.time("shap"):
+                if (mode or self.mode) == 'shap' or not self._supports_linear():
+                    return self.explainer(text_list)
+                return self._linear_explanation(text_list)
+        except Exception as e:
+            print(f"[ERROR] SHAP Trace Failure: {e}")
+            METRICS.inc("shap_failures")
+            return None
+
+    def _linear_explanation(self, text_list):
+        """
+        Exact attribution for logistic regression on TF-IDF.
+        Each term contributes coef_j * tfidf_j to the log-odds (split evenly
+        across its occurrences); contributions are then rescaled into
+        probability units so values sum to f(x) - f(masked), like SHAP's
+        Text masker output, and render with shap.plots.text unchanged.
+        """
+        import shap
+        if self._analyzer is None:
+            self._analyzer = self.vectorizer.build_analyzer()
+        coef = self.model.coef_[0]
+        intercept = float(self.model.intercept_[0])
+        base = 1.0 / (1.0 + np.exp(-intercept))
+        vocab = self.vectorizer.vocabulary_
+        matrix = self.vectorizer.transform(text_list).tocsr()
+
+        all_values, all_data = [], []
+        for i, text in enumerate(text_list):
+            segments, tokens = self.masker.token_segments(text) if text else ([], [])
+            row = matrix.getrow(i)
+            term_logit = dict(zip(row.indices.tolist(), (row.data * coef[row.indices]).tolist()))
+
+            token_cols = [[vocab[t] for t in self._analyzer(tok) if t in vocab] for tok in tokens]
+            occurrences = {}
+            for cols in token_cols:
+                for col in cols:
+                    occurrences[col] = occurrences.get(col, 0) + 1
+            token_logit = np.array([
+                sum(term_logit.get(col, 0.0) / occurrences[col] for col in cols) for cols in token_cols
+            ], dtype=float)
+
+            delta_logit = sum(term_logit.values())
+            prob = 1.0 / (1.0 + np.exp(-(intercept + delta_logit)))
+            scale = (prob - base) / delta_logit if abs(delta_logit) > 1e-12 else prob * (1.0 - prob)
+            all_values.append(token_logit * scale)
+            all_data.append(np.array(segments, dtype=object))
+
+        values = np.empty(len(all_values), dtype=object)
+        values[:] = all_values
+        data = np.empty(len(all_data), dtype=object)
+        data[:] = all_data
+        return shap.Explanation(values=values, base_values=np.full(len(all_values), base), data=data)
+
+    @PROFILER.wrap("get_linguistic_audit")
+    def get_linguistic_audit(self, text):
+        """
+        Aether Linguistic Intelligence Agent.
+        Scans text for syntactic anomalies and emotional triggers.
+        """
+        if not text:
+            return {"status": "error", "report": ["No input provided."]}
+            
+        with METRICS.time("audit"):
+            return self._linguistic_audit(text)
+
+    def _linguistic_audit(self, text):
+        word_count, caps_count, exclamations, question_marks = scalar_counts(text)
+        
+        # Forensic Scoring logic
+        sensationalism_score = (caps_count / (word_count + 1)) * 100
+        urgency_score = (exclamations / (word_count + 1)) * 100
+        speculation_ratio = (question_marks / (word_count + 1)) * 100
+        
+        report = []
+        if sensationalism_score > AUDIT_THRESHOLDS["sensationalism"]:
+            report.append(f"⚠️ HIGH SENSATIONALISM: {caps_count} words are in ALL CAPS. Pattern matching clickbait signatures.")
+        if urgency_score > AUDIT_THRESHOLDS["urgency"]:
+            report.append(f"🚨 URGENCY MARKERS: High frequency of exclamation marks ({exclamations}). Likely emotional provocation.")
+        if speculation_ratio > AUDIT_THRESHOLDS["speculation"]:
+            report.append("❓ SPECULATIVE TONE: High density of interrogation marks. Suggests unverified inquiry patterns.")
+        if word_count < AUDIT_THRESHOLDS["min_words"]:
+            report.append("📉 LOW SUBSTANCE: Article length below forensic threshold. Legitimate reports typically provide greater context.")
+            
+        return {
+            "assessment": assess(len(report)),
+            "report": report if report else ["Linguistic patterns verified within professional benchmarks."],
+            "stats": {
+                "Sensationalism": f"{sensationalism_score:.1f}%",
+                "Urgency": f"{urgency_score:.1f}%",
+                "Speculation": f"{speculation_ratio:.1f}%"
+            }
+        }
+
+    def get_linguistic_audit_batch(self, texts):
+        """
+        Vectorized audit over a column of texts (list or Series).
+        Returns a typed DataFrame matching get_linguistic_audit row for row.
+        """
+        with METRICS.time("audit_batch"):
+            return linguistic_audit_frame(texts)
+
+    @PROFILER.wrap("get_related_intel")
+    def get_related_intel(self, query_text, dataset_df):
+        """
+        Synchronizes with historic archives to find semantic overlaps.
+        """
+        if not query_text or dataset_df is None:
+            return []
+            
+        with METRICS.time("related"):
+            return self._related_intel(query_text, dataset_df)
+
+    def _related_intel(self, query_text, dataset_df):
+        if self.related_index is not None and self.related_index.refresh() \
+                and self.related_index.n_rows == len(dataset_df):
+            return self._format_related(
+                (dataset_df.iloc[idx], score) for idx, score in self.related_index.query(query_text, k=5)
+            )
+            
+        from sklearn.metrics.pairwise import cosine_similarity
+        
+        query_vec = self.vectorizer.transform([str(query_text)])
+        sample_size = min(len(dataset_df), 4000) # Increased precision
+        subset = dataset_df.sample(sample_size, random_state=42)
+        
+        dataset_vecs = self.vectorizer.transform(subset['total_text'].astype(str))
+        similarities = cosine_similarity(query_vec, dataset_vecs).flatten()
+        
+        # Extract top forensic matches
+        top_indices = similarities.argsort()[-5:][::-1]
+        return self._format_related((subset.iloc[idx], similarities[idx]) for idx in top_indices)
+
+    def _format_related(self, matches):
+        results = []
+        for row, score in matches:
+            if score < 0.08: continue 
+            
+            results.append({
+                "title": str(row['title']).strip(),
+                "content": str(row['text']).strip()[:350] + "...",
+                "similarity": f"{score:.1%}",
+                "status": "Verified" if row['target'] == 1 else "Flagged",
+                "label": "REAL" if row['target'] == 1 else "FAKE"
+            })
+        return results
+
+    def get_global_importance(self):
+        """
+        Extracts global neural weightings for authentic vs anomalous markers.
+        """
+        import pandas as pd
+        coefs = self.model.coef_[0]
+        features = self.vectorizer.get_feature_names_out()
+        
+        importance_df = pd.DataFrame({'word': features, 'coefficient': coefs})
+        
+        real_indicators = importance_df.sort_values(by='coefficient', ascending=False).head(25).copy()
+        fake_indicators = importance_df.sort_values(by='coefficient', ascending=True).head(25).copy()
+        
+        real_indicators.columns = ['AUTHENTIC_MARKER', 'WEIGHT']
+        fake_indicators.columns = ['ANOMALY_TRIGGER', 'WEIGHT']
+        
+        return real_indicators, fake_indicators
@@ -0,0 +1,123 @@
+import json
+import math
+import os
+import re
+import numpy as np
+
+COMPACT_VERSION = 1
+
+def export_compact(model, vectorizer, out_dir='models/compact', dtype='float64'):
+    """
+    Writes a sklearn-free, memory-mappable copy of the trained Sentinel:
+      vocab.npy    sorted fixed-width term array (binary-searched at lookup)
+      columns.npy  original feature column for each sorted term
+      idf.npy      idf_ weights, original column order
+      coef.npy     coef_[0], original column order
+      meta.json    intercept, tokenizer and weighting settings
+    dtype='float64' reproduces predict_proba exactly; 'float32' halves the
+    footprint, with probabilities off by ~2e-9 on the bundled corpus.
+    """
+    params = vectorizer.get_params()
+    unsupported = {
+        "analyzer": params["analyzer"] != 'word',
+        "ngram_range": tuple(params["ngram_range"]) != (1, 1),
+        "tokenizer": params["tokenizer"] is not None,
+        "preprocessor": params["preprocessor"] is not None,
+        "strip_accents": params["strip_accents"] is not None,
+        "binary": params["binary"],
+        "norm": params["norm"] not in ('l2', None),
+        "classes": getattr(model, "coef_", np.empty((2, 0))).shape[0] != 1
+    }
+    bad = [name for name, flag in unsupported.items() if flag]
+    if bad:
+        raise ValueError(f"Compact export does not support: {', '.join(bad)}")
+
+    os.makedirs(out_dir, exist_ok=True)
+    terms = sorted(vectorizer.vocabulary_)
+    columns = np.array([vectorizer.vocabulary_[t] for t in terms], dtype=np.int32)
+    n_features = len(vectorizer.vocabulary_)
+    idf = np.asarray(vectorizer.idf_ if params["use_idf"] else np.ones(n_features), dtype=dtype)
+
+    np.save(os.path.join(out_dir, "vocab.npy"), np.array(terms, dtype=str))
+    np.save(os.path.join(out_dir, "columns.npy"), columns)
+    np.save(os.path.join(out_dir, "idf.npy"), idf)
+    np.save(os.path.join(out_dir, "coef.npy"), np.asarray(model.coef_[0], dtype=dtype))
+    meta = {
+        "version": COMPACT_VERSION,
+        "intercept": float(model.intercept_[0]),
+        "classes": [int(c) for c in model.classes_],
+        "token_pattern": params["token_pattern"],
+        "lowercase": params["lowercase"],
+        "sublinear_tf": params["sublinear_tf"],
+        "norm": params["norm"],
+        "dtype": dtype
+    }
+    with open(os.path.join(out_dir, "meta.json"), "w") as f:
+        json.dump(meta, f, indent=2)
+    print(f"[EXPORT] Compact model ({n_features} terms, {dtype}) written to {out_dir}")
+    return out_dir
+
+class AetherCompactScorer:
+    """
+    Pure-NumPy scorer for a compact export.
+    Arrays are memory-mapped read-only, so any number of worker processes
+    share one copy of the weights through the page cache. Expects text that
+    has already been through AetherDataProcessor.clean_text, like the
+    vectorizer it replaces.
+    """
+    def __init__(self, model_dir='models/compact', mmap=True):
+        mode = 'r' if mmap else None
+        with open(os.path.join(model_dir, "meta.json"), "r") as f:
+            self.meta = json.load(f)
+        self.vocab = np.load(os.path.join(model_dir, "vocab.npy"), mmap_mode=mode)
+        self.columns = np.load(os.path.join(model_dir, "columns.npy"), mmap_mode=mode)
+        self.idf = np.load(os.path.join(model_dir, "idf.npy"), mmap_mode=mode)
+        self.coef = np.load(os.path.join(model_dir, "coef.npy"), mmap_mode=mode)
+        self.intercept = self.meta["intercept"]
+        self.classes_ = np.array(self.meta["classes"])
+        self.max_term_len = self.vocab.dtype.itemsize // 4
+        self.token_pattern = re.compile(self.meta["token_pattern"])
+
+    def _decision(self, text):
+        if self.meta["lowercase"]:
+            text = text.lower()
+        tokens = self.token_pattern.findall(text)
+        if not tokens:
+            return self.intercept
+        # Longer tokens cannot be terms; casting them to the fixed-width dtype would truncate them into one
+        tokens = [t for t in tokens if len(t) <= self.max_term_len]
+        if not tokens:
+            return self.intercept
+        tokens = np.array(tokens, dtype=self.vocab.dtype)
+        pos = np.searchsorted(self.vocab, tokens)
+        pos[pos == len(self.vocab)] = 0
+        pos = pos[self.vocab[pos] == tokens]
+        if pos.size == 0:
+            return self.intercept
+
+        # Original column order so float summation matches sklearn's CSR kernels
+        cols, counts = np.unique(self.columns[pos], return_counts=True)
+        weights = counts.astype(np.float64)
+        if self.meta["sublinear_tf"]:
+            weights = np.log(weights) + 1.0
+        weights *= self.idf[cols]
+        if self.meta["norm"] == 'l2':
+            norm = np.sqrt(np.cumsum(weights * weights)[-1])
+            if norm > 0:
+                weights /= norm
+        return np.cumsum(weights * self.coef[cols])[-1] + self.intercept
+
+    def transform(self, texts):
+        # Pass-through: lets the scorer stand in for both vectorizer and model in AetherPredictor
+        return list(texts)
+
+    def decision_function(self, texts):
+        return np.array([self._decision(t) for t in texts], dtype=np.float64)
+
+    def predict_proba(self, texts):
+        """
+        Same layout as LogisticRegression.predict_proba: [P(class 0), P(class 1)].
+        """
+        # libm exp (not NumPy's SIMD exp) keeps the sigmoid bit-identical to scipy's expit
+        prob = np.array([1.0 / (1.0 + math.exp(-d)) for d in self.decision_function(texts)], dtype=np.float64)
+        return np.stack([1 - prob, prob], axis=1)
@@ -0,0 +1,135 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import datetime
+
+class AetherHistoryStore:
+    """
+    Scan history backed by a local SQLite database in WAL mode.
+    Inserts and deletes touch a single row, the 24h window is served by a
+    timestamp index, and WAL lets many readers run alongside concurrent
+    writers from other Streamlit sessions or processes. Scan ids are random
+    UUIDs, so concurrent writers can never overwrite each other's rows.
+    """
+    def __init__(self, db_path='data/history.db', legacy_json='data/history.json'):
+        self.db_path = db_path
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS scans (
+                    id TEXT PRIMARY KEY,
+                    ts REAL NOT NULL,
+                    timestamp TEXT NOT NULL,
+                    text TEXT,
+                    score REAL,
+                    label TEXT
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_scans_ts ON scans(ts)")
+        if legacy_json:
+            self._migrate(legacy_json)
+
+    def _connect(self):
+        # sqlite3 connections are not shareable across threads; keep one per thread
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def new_id():
+        return uuid.uuid4().hex
+
+    @staticmethod
+    def _row(entry):
+        return (
+            str(entry.get('id') or AetherHistoryStore.new_id()),
+            datetime.fromisoformat(entry['timestamp']).timestamp(),
+            entry['timestamp'],
+            entry.get('text'),
+            entry.get('score'),
+            entry.get('label')
+        )
+
+    def _migrate(self, legacy_json):
+        """
+        One-time import of the old history.json, tracked via PRAGMA user_version.
+        Entries without an id get a fresh one; entries without a usable
+        timestamp are skipped rather than aborting the whole import.
+        """
+        conn = self._connect()
+        if conn.execute("PRAGMA user_version").fetchone()[0] >= 1:
+            return
+        try:
+            entries = []
+            if os.path.exists(legacy_json):
+                with open(legacy_json, "r") as f:
+                    entries = json.load(f)
+            if not isinstance(entries, list):
+                raise ValueError(f"{legacy_json} does not hold a list of scans")
+        except (OSError, ValueError) as e:
+            # user_version stays 0, so the import is retried once the file is readable
+            print(f"[ERROR] History migration failure: {e}")
+            return
+
+        rows, skipped = [], 0
+        for entry in entries:
+            try:
+                rows.append(self._row(entry))
+            except (AttributeError, KeyError, TypeError, ValueError):
+                skipped += 1
+        with conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO scans (id, ts, timestamp, text, score, label) VALUES (?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            conn.execute("PRAGMA user_version = 1")
+        if entries:
+            print(f"[HISTORY] Migrated {len(rows)} records from {legacy_json} ({skipped} malformed skipped)")
+
+    def add(self, entry):
+        """
+        Stores a scan, assigning entry['id'] when it has none. Returns the id.
+        """
+        entry.setdefault('id', self.new_id())
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO scans (id, ts, timestamp, text, score, label) VALUES (?, ?, ?, ?, ?, ?)",
+                self._row(entry)
+            )
+        return entry['id']
+
+    def delete(self, entry_id):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM scans WHERE id = ?", (str(entry_id),))
+
+    def clear(self):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM scans")
+
+    def recent(self, hours=24):
+        """
+        Returns scans from the last `hours`, newest first.
+        """
+        cutoff = time.time() - hours * 3600
+        rows = self._connect().execute(
+            "SELECT id, timestamp, text, score, label FROM scans WHERE ts >= ? ORDER BY ts DESC",
+            (cutoff,)
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def prune(self, hours=24):
+        """
+        Compacts the store by dropping scans older than the retention window.
+        """
+        cutoff = time.time() - hours * 3600
+        with self._connect() as conn:
+            conn.execute("DELETE FROM scans WHERE ts < ?", (cutoff,))
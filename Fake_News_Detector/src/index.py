@@ -0,0 +1,186 @@
+import copy
+import hashlib
+import json
+import os
+import threading
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+from sklearn.preprocessing import normalize
+from src.ann import AetherExactSearch
+from src.ingest import shard_paths, shards_current
+
+DEFAULT_SOURCES = (('data/raw/True.csv', 1), ('data/raw/Fake.csv', 0))
+
+def _file_digest(path, limit=None):
+    digest = hashlib.sha256()
+    remaining = limit
+    with open(path, "rb") as f:
+        while remaining is None or remaining > 0:
+            size = 1 << 20 if remaining is None else min(1 << 20, remaining)
+            block = f.read(size)
+            if not block:
+                break
+            digest.update(block)
+            if remaining is not None:
+                remaining -= len(block)
+    return digest.hexdigest()
+
+def vectorizer_signature(vectorizer):
+    """
+    Stable fingerprint of a fitted vectorizer (vocabulary + idf weights).
+    """
+    digest = hashlib.sha256()
+    vocab = sorted((term, int(col)) for term, col in vectorizer.vocabulary_.items())
+    digest.update(json.dumps(vocab).encode())
+    idf = getattr(vectorizer, "idf_", None)
+    if idf is not None:
+        digest.update(np.ascontiguousarray(idf).tobytes())
+    return digest.hexdigest()
+
+def archive_texts(df):
+    return (df['title'].fillna('') + " " + df['text'].fillna('')).astype(str)
+
+class AetherSimilarityIndex:
+    """
+    Precomputed semantic index over the full news archive.
+    Stores one L2-normalized TF-IDF block per source CSV as .npz and answers
+    related-article queries with a single sparse mat-vec + argpartition.
+    Blocks are rebuilt incrementally: untouched sources are reused, appended
+    rows are vectorized on their own, and only rewritten files are redone.
+    Search is delegated to a pluggable backend (exact by default, or an
+    approximate one such as AetherLSHSearch for very large archives); each
+    refresh fits a fresh copy of it, so queries never see a half-built one.
+    With shard_dir set, the blocks are built from the cleaned shards written
+    by AetherCorpusStreamer instead (same rows, same order as the archives),
+    and the index reports not-ready while those shards predate the archives.
+    """
+    def __init__(self, vectorizer, sources=DEFAULT_SOURCES, index_dir='models/index', backend=None, shard_dir=None):
+        self.vectorizer = vectorizer
+        self.backend = backend or AetherExactSearch()
+        self.sources = tuple(sources)
+        self.shard_dir = shard_dir
+        self.index_dir = index_dir
+        self.manifest_path = os.path.join(index_dir, 'manifest.json')
+        self.matrix = None
+        self.n_rows = 0
+        # (fitted backend, n_rows), swapped as one reference so query() reads a consistent pair
+        self._live = (None, 0)
+        self._stat = None
+        self._lock = threading.Lock()
+
+    def _current_sources(self):
+        if self.shard_dir is None:
+            return self.sources
+        if not shards_current(self.shard_dir):
+            return ()
+        return tuple((path, None) for path in shard_paths(self.shard_dir))
+
+    def _stat_signature(self, sources):
+        if not sources:
+            return None
+        try:
+            return tuple((p, os.stat(p).st_mtime_ns, os.stat(p).st_size) for p, _ in sources)
+        except OSError:
+            return None
+
+    def _block_path(self, source_path):
+        stem = os.path.splitext(os.path.basename(source_path))[0]
+        return os.path.join(self.index_dir, f"{stem}.npz")
+
+    def _load_manifest(self):
+        try:
+            with open(self.manifest_path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _vectorize(self, df):
+        return normalize(self.vectorizer.transform(archive_texts(df)), norm='l2', copy=False).tocsr()
+
+    def _sync_block(self, source_path, entry, vec_sig):
+        size = os.path.getsize(source_path)
+        block_path = self._block_path(source_path)
+        usable = entry and entry.get("vectorizer") == vec_sig and os.path.exists(block_path)
+
+        if usable and entry["size"] == size and entry["sha256"] == _file_digest(source_path):
+            return sp.load_npz(block_path).tocsr(), entry, "reused"
+
+        df = pd.read_csv(source_path)
+        if usable and entry["size"] < size and entry["n_rows"] <= len(df) \
+                and entry["sha256"] == _file_digest(source_path, limit=entry["size"]):
+            # Append-only change: vectorize just the new tail
+            old_block = sp.load_npz(block_path).tocsr()
+            block = sp.vstack([old_block, self._vectorize(df.iloc[entry["n_rows"]:])], format='csr')
+            mode = "appended"
+        else:
+            block = self._vectorize(df)
+            mode = "rebuilt"
+
+        sp.save_npz(block_path, block)
+        entry = {
+            "size": size,
+            "sha256": _file_digest(source_path),
+            "n_rows": block.shape[0],
+            "vectorizer": vec_sig
+        }
+        return block, entry, mode
+
+    def refresh(self):
+        """
+        Brings the on-disk index in line with the archive CSVs and loads it.
+        Returns True when the index is ready to serve queries.
+        """
+        sources = self._current_sources()
+        signature = self._stat_signature(sources)
+        if signature is None:
+            return False
+        if signature == self._stat:
+            return True
+        with self._lock:
+            if signature == self._stat:
+                return True
+            os.makedirs(self.index_dir, exist_ok=True)
+            manifest = self._load_manifest()
+            vec_sig = vectorizer_signature(self.vectorizer)
+            blocks, new_manifest = [], {}
+            for source_path, _ in sources:
+                block, entry, mode = self._sync_block(source_path, manifest.get(source_path), vec_sig)
+                blocks.append(block)
+                new_manifest[source_path] = entry
+                if mode != "reused":
+                    print(f"[INDEX] {source_path}: {mode} ({block.shape[0]} rows)")
+            # Blocks of sources that are gone (e.g. a shard set rewritten with fewer shards)
+            live_blocks = {self._block_path(p) for p in new_manifest}
+            for gone in set(manifest) - set(new_manifest):
+                if self._block_path(gone) not in live_blocks:
+                    try:
+                        os.remove(self._block_path(gone))
+                    except OSError:
+                        pass
+
+            tmp_path = f"{self.manifest_path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(new_manifest, f, indent=2)
+            os.replace(tmp_path, self.manifest_path)
+
+            matrix = sp.vstack(blocks, format='csr')
+            searcher = copy.copy(self.backend).fit(matrix)
+            self.matrix, self.n_rows = matrix, matrix.shape[0]
+            self._live = (searcher, self.n_rows)
+            self._stat = signature
+        return True
+
+    def query(self, query_text, k=5):
+        """
+        Returns up to k (row, cosine_similarity) pairs, best first.
+        Row numbers follow the concatenated source order.
+        """
+        if not self.refresh():
+            return []
+        searcher, n_rows = self._live
+        if n_rows == 0:
+            return []
+        query_vec = normalize(self.vectorizer.transform([str(query_text)]), norm='l2')
+        rows, scores = searcher.search(query_vec, k)
+        return [(int(i), float(score)) for i, score in zip(rows, scores)]
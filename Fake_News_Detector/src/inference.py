@@ -0,0 +1,93 @@
+import joblib
+import numpy as np
+import time
+from itertools import islice
+from src.metrics import METRICS
+from src.preprocessing import AetherDataProcessor
+from src.profiling import PROFILER
+
+class AetherPredictor:
+    """
+    Inference-only core of the Aether Sentinel.
+    Holds a loaded model, vectorizer and preprocessor with no training state,
+    so a single instance can be shared by every scan request.
+    """
+    def __init__(self, model, vectorizer, preprocessor=None):
+        self.model = model
+        self.vectorizer = vectorizer
+        self.preprocessor = preprocessor or AetherDataProcessor()
+
+    @classmethod
+    def from_artifacts(cls, model_path='models/model.pkl', vec_path='models/vectorizer.pkl', preprocessor=None):
+        """
+        Builds a predictor of this class from archived artifacts.
+        Subclasses with a different constructor override this.
+        """
+        model = joblib.load(model_path)
+        vectorizer = joblib.load(vec_path)
+        return cls(model, vectorizer, preprocessor)
+
+    @staticmethod
+    def from_compact(model_dir='models/compact', preprocessor=None):
+        """
+        Builds a predictor on the memory-mapped compact export (no sklearn unpickling).
+        The export holds only decision weights, so this is always a plain AetherPredictor.
+        """
+        from src.export import AetherCompactScorer
+        scorer = AetherCompactScorer(model_dir)
+        return AetherPredictor(scorer, scorer, preprocessor)
+
+    @PROFILER.wrap("predict")
+    def predict(self, raw_text):
+        """
+        Runs a single text trace through the calibrated engine.
+        """
+        start = time.perf_counter()
+        cleaned = self.preprocessor.clean_text(raw_text)
+        cleaned_at = time.perf_counter()
+        vec = self.vectorizer.transform([cleaned])
+        vectorized_at = time.perf_counter()
+        prob = self.model.predict_proba(vec)[0]
+        METRICS.observe("clean", cleaned_at - start)
+        METRICS.observe("vectorize", vectorized_at - cleaned_at)
+        METRICS.observe("predict", time.perf_counter() - vectorized_at)
+        METRICS.inc("documents_scored")
+        return prob
+
+    def predict_cleaned(self, cleaned_texts):
+        """
+        Scores texts that already went through clean_text in one sparse batch.
+        """
+        with METRICS.time("predict_batch"):
+            probs = self.model.predict_proba(self.vectorizer.transform(cleaned_texts))
+        METRICS.inc("documents_scored", len(probs))
+        return probs
+
+    def iter_predict_many(self, texts, batch_size=1024):
+        """
+        Streams texts through the engine in sparse batches.
+        Yields one (n, 2) probability block per batch, so generator
+        feeds are never materialized in memory.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        stream = iter(texts)
+        while True:
+            batch = list(islice(stream, batch_size))
+            if not batch:
+                break
+            with METRICS.time("clean_batch"):
+                cleaned = [self.preprocessor.clean_text(t) for t in batch]
+            yield self.predict_cleaned(cleaned)
+
+    @PROFILER.wrap("predict_many")
+    def predict_many(self, texts, batch_size=1024):
+        """
+        Runs a batch of text traces through the calibrated engine.
+        Accepts any iterable (lists, Series, generators) and returns
+        an (n, 2) array of [fake, real] probabilities.
+        """
+        blocks = list(self.iter_predict_many(texts, batch_size=batch_size))
+        if not blocks:
+            return np.empty((0, len(self.model.classes_)))
+        return np.vstack(blocks)
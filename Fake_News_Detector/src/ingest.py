@@ -0,0 +1,127 @@
+import glob
+import json
+import os
+import time
+import numpy as np
+import pandas as pd
+from itertools import repeat, zip_longest
+from src.preprocessing import resolve_workers
+
+SHARD_PATTERN = "shard-*.csv.gz"
+
+class AetherCorpusStreamer:
+    """
+    Streaming ingestion for archives larger than RAM.
+    Reads the raw CSVs in fixed-size chunks, labels and cleans each chunk,
+    and writes it out as a compressed shard, so peak memory is bounded by
+    the chunk size rather than the corpus size.
+    """
+    def __init__(self, preprocessor, chunksize=10000, n_jobs=1):
+        self.preprocessor = preprocessor
+        self.chunksize = chunksize
+        self.n_jobs = n_jobs
+
+    def iter_chunks(self, true_csv, fake_csv):
+        """
+        Yields labeled raw chunks (True archive first, then Fake).
+        """
+        for path, label in ((true_csv, 1), (fake_csv, 0)):
+            for chunk in pd.read_csv(path, chunksize=self.chunksize):
+                chunk['target'] = label
+                chunk['total_text'] = chunk['title'].fillna('') + " " + chunk['text'].fillna('')
+                yield chunk
+
+    def iter_mixed_chunks(self, true_csv, fake_csv, seed=42, skip=(0, 0)):
+        """
+        Yields shuffled chunks drawing from both archives in lockstep,
+        so order-sensitive learners (SGD) never see one class for long.
+        skip gives the number of leading data rows to pass over in each archive.
+        """
+        # The label travels beside each reader: a generator closing over the loop
+        # variable would see only its last value and tag every row as fabricated
+        readers = [
+            zip(pd.read_csv(path, chunksize=self.chunksize, skiprows=range(1, rows + 1)), repeat(label))
+            for (path, label), rows in zip(((true_csv, 1), (fake_csv, 0)), skip)
+        ]
+        rng = np.random.default_rng(seed)
+        for pair in zip_longest(*readers):
+            parts = []
+            for item in pair:
+                if item is not None:
+                    chunk, label = item
+                    chunk['target'] = label
+                    parts.append(chunk)
+            chunk = pd.concat(parts, ignore_index=True)
+            chunk['total_text'] = chunk['title'].fillna('') + " " + chunk['text'].fillna('')
+            yield chunk.iloc[rng.permutation(len(chunk))].reset_index(drop=True)
+
+    def write_shards(self, true_csv, fake_csv, out_dir='data/shards'):
+        """
+        Cleans the archives chunk by chunk into out_dir/shard-NNNNN.csv.gz.
+        Each shard keeps raw title/text alongside the cleaned total_text.
+        """
+        os.makedirs(out_dir, exist_ok=True)
+        for stale in glob.glob(os.path.join(out_dir, SHARD_PATTERN)) + [os.path.join(out_dir, "manifest.json")]:
+            if os.path.exists(stale):
+                os.remove(stale)
+        # Recorded up front so shards_current() can tell when the archives moved on
+        sources = {
+            os.path.abspath(p): {"size": os.stat(p).st_size, "mtime_ns": os.stat(p).st_mtime_ns}
+            for p in (true_csv, fake_csv)
+        }
+
+        workers = resolve_workers(self.n_jobs)
+        pool = self.preprocessor.worker_pool(workers)
+        shards, total, start_time = [], 0, time.time()
+        try:
+            for i, chunk in enumerate(self.iter_chunks(true_csv, fake_csv)):
+                chunk['total_text'] = self.preprocessor.clean_many(chunk['total_text'], n_jobs=workers, executor=pool)
+                path = os.path.join(out_dir, f"shard-{i:05d}.csv.gz")
+                chunk[['title', 'text', 'total_text', 'target']].to_csv(path, index=False)
+                shards.append({"path": os.path.basename(path), "rows": len(chunk)})
+                total += len(chunk)
+                print(f"[DATA_SYNC] Shard {i:05d}: {len(chunk)} records ({total} total, {time.time() - start_time:.2f}s)")
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        with open(os.path.join(out_dir, "manifest.json"), "w") as f:
+            json.dump({"records": total, "shards": shards, "sources": sources}, f, indent=2)
+        self.preprocessor.lemma_cache.save()
+        return [os.path.join(out_dir, s["path"]) for s in shards]
+
+def shard_paths(shard_dir='data/shards'):
+    return sorted(glob.glob(os.path.join(shard_dir, SHARD_PATTERN)))
+
+def shards_current(shard_dir='data/shards'):
+    """
+    True when shard_dir holds a complete shard set written from the archives as they are now.
+    """
+    try:
+        with open(os.path.join(shard_dir, "manifest.json"), "r") as f:
+            sources = json.load(f)["sources"]
+        return all(
+            os.stat(path).st_size == stat["size"] and os.stat(path).st_mtime_ns == stat["mtime_ns"]
+            for path, stat in sources.items()
+        )
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return False
+
+def iter_shards(shard_dir='data/shards', columns=None):
+    """
+    Yields cleaned shards one at a time, in corpus order.
+    """
+    for path in shard_paths(shard_dir):
+        yield pd.read_csv(path, usecols=columns, keep_default_na=False)
+
+def load_shards(shard_dir='data/shards', columns=('total_text', 'target')):
+    """
+    Materializes only the requested columns (by default just what training needs).
+    The batch TF-IDF fit needs the whole corpus at once, so this still holds every
+    cleaned row in memory: shards bound the peak while cleaning, not while fitting.
+    Use iter_shards (or train.py --online) when the corpus itself does not fit.
+    """
+    frames = list(iter_shards(shard_dir, columns=list(columns) if columns else None))
+    if not frames:
+        raise FileNotFoundError(f"No shards found in {shard_dir}")
+    return pd.concat(frames, ignore_index=True)
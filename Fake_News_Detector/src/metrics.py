@@ -0,0 +1,238 @@
+import hashlib
+import json
+import math
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+
+# Latency buckets in seconds (upper bounds), Prometheus-style
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Display order; predict_batch covers vectorize + predict_proba for a whole batch
+STAGES = (
+    "scan", "clean", "vectorize", "predict", "clean_batch", "predict_batch",
+    "shap", "audit", "audit_batch", "related",
+)
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+class AetherHistogram:
+    """
+    Fixed-bucket latency histogram with a bounded window of recent samples
+    for exact percentiles over recent traffic.
+    """
+    def __init__(self, buckets=LATENCY_BUCKETS, window=2048):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.recent = deque(maxlen=window)
+
+    def observe(self, seconds):
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        self.recent.append(seconds)
+
+    def percentile(self, q):
+        if not self.recent:
+            return None
+        ordered = sorted(self.recent)
+        return ordered[min(len(ordered) - 1, int(math.ceil(q / 100.0 * len(ordered))) - 1)]
+
+class _StageTimer:
+    __slots__ = ("metrics", "stage", "start")
+
+    def __init__(self, metrics, stage):
+        self.metrics = metrics
+        self.stage = stage
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.metrics.observe(self.stage, time.perf_counter() - self.start)
+        return False
+
+class AetherMetrics:
+    """
+    Process-wide instrumentation for the Aether Sentinel.
+    Records per-stage latency histograms and event counters from the engine
+    and explainer, and polls registered collectors (cache statistics, model
+    evaluation) whenever a snapshot or Prometheus exposition is taken.
+    """
+    def __init__(self):
+        self.started = time.time()
+        self._histograms = {}
+        self._counters = {}
+        self._collectors = {}
+        self._lock = threading.Lock()
+
+    def observe(self, stage, seconds):
+        with self._lock:
+            histogram = self._histograms.get(stage)
+            if histogram is None:
+                histogram = self._histograms[stage] = AetherHistogram()
+            histogram.observe(seconds)
+
+    def time(self, stage):
+        """
+        Context manager recording the duration of its block under stage.
+        """
+        return _StageTimer(self, stage)
+
+    def inc(self, event, n=1):
+        with self._lock:
+            self._counters[event] = self._counters.get(event, 0) + n
+
+    def register_collector(self, name, fn):
+        """
+        Registers fn() -> dict of numbers, polled at snapshot time (replaces any previous fn for name).
+        """
+        with self._lock:
+            self._collectors[name] = fn
+
+    def _collect(self):
+        with self._lock:
+            collectors = list(self._collectors.items())
+        collected = {}
+        for name, fn in collectors:
+            try:
+                values = fn() or {}
+            except Exception as e:
+                print(f"[METRICS] Collector '{name}' failed: {e}")
+                continue
+            collected[name] = {
+                k: v for k, v in values.items()
+                if isinstance(v, (int, float)) and not isinstance(v, bool)
+            }
+        return collected
+
+    def snapshot(self):
+        """
+        Point-in-time view: stage latency summaries (ms), counters and collector values.
+        """
+        with self._lock:
+            stages = {}
+            for stage, h in self._histograms.items():
+                p50, p95, p99 = h.percentile(50), h.percentile(95), h.percentile(99)
+                stages[stage] = {
+                    "count": h.count,
+                    "mean_ms": h.sum / h.count * 1000 if h.count else None,
+                    "p50_ms": p50 * 1000 if p50 is not None else None,
+                    "p95_ms": p95 * 1000 if p95 is not None else None,
+                    "p99_ms": p99 * 1000 if p99 is not None else None,
+                }
+            counters = dict(self._counters)
+        return {
+            "uptime_seconds": time.time() - self.started,
+            "stages": stages,
+            "counters": counters,
+            "collectors": self._collect(),
+        }
+
+    def render_prometheus(self):
+        """
+        Prometheus text exposition (format 0.0.4) of every metric.
+        """
+        lines = [
+            "# HELP aether_uptime_seconds Seconds since the metrics registry started.",
+            "# TYPE aether_uptime_seconds gauge",
+            f"aether_uptime_seconds {time.time() - self.started:.3f}",
+            "# HELP aether_stage_latency_seconds Latency of Aether engine stages.",
+            "# TYPE aether_stage_latency_seconds histogram",
+        ]
+        with self._lock:
+            histograms = [(s, list(h.counts), h.count, h.sum) for s, h in sorted(self._histograms.items())]
+            counters = sorted(self._counters.items())
+        for stage, counts, count, total in histograms:
+            cumulative = 0
+            for bound, n in zip(LATENCY_BUCKETS, counts):
+                cumulative += n
+                lines.append(f'aether_stage_latency_seconds_bucket{{stage="{stage}",le="{bound}"}} {cumulative}')
+            lines.append(f'aether_stage_latency_seconds_bucket{{stage="{stage}",le="+Inf"}} {count}')
+            lines.append(f'aether_stage_latency_seconds_sum{{stage="{stage}"}} {total:.6f}')
+            lines.append(f'aether_stage_latency_seconds_count{{stage="{stage}"}} {count}')
+
+        lines += ["# HELP aether_events_total Engine events by type.", "# TYPE aether_events_total counter"]
+        lines += [f'aether_events_total{{event="{event}"}} {n}' for event, n in counters]
+
+        for name, values in sorted(self._collect().items()):
+            for key, value in sorted(values.items()):
+                metric = f"aether_{name}_{key}"
+                lines += [f"# TYPE {metric} gauge", f"{metric} {value}"]
+        return "\n".join(lines) + "\n"
+
+METRICS = AetherMetrics()
+
+def artifact_hash(model_path, vec_path):
+    """
+    Content version of an artifact pair: sha256 over the model bytes, then the vectorizer bytes.
+    """
+    digest = hashlib.sha256()
+    for path in (model_path, vec_path):
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+    return digest.hexdigest()
+
+def save_eval_metrics(metrics, path):
+    """
+    Archives the evaluation of a training run as JSON next to the model.
+    """
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(metrics, f, indent=2)
+    os.replace(tmp_path, path)
+
+def load_eval_metrics(path):
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+class AetherMetricsExporter:
+    """
+    Minimal local HTTP endpoint serving GET /metrics for Prometheus scrapers.
+    Runs on a daemon thread so it never blocks the host process.
+    """
+    def __init__(self, metrics=None, host='127.0.0.1', port=9108):
+        self.metrics = metrics or METRICS
+        self.host = host
+        self.port = port
+        self._server = None
+
+    def start(self):
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        metrics = self.metrics
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?', 1)[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = metrics.render_prometheus().encode('utf-8')
+                self.send_response(200)
+                self.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        threading.Thread(target=self._server.serve_forever, name="aether-metrics", daemon=True).start()
+        print(f"[METRICS] Prometheus endpoint on http://{self.host}:{self.port}/metrics")
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
@@ -0,0 +1,115 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+# Project-local corpus vault; the only place NLTK is allowed to read from at runtime
+NLTK_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'nltk_data')
+MANIFEST_FILE = 'manifest.json'
+
+# Package id -> archive path inside an nltk_data tree.
+# clean_text tokenizes itself, so the punkt tokenizers are not needed.
+REQUIRED_ASSETS = {
+    'stopwords': 'corpora/stopwords.zip',
+    'wordnet': 'corpora/wordnet.zip',
+    'omw-1.4': 'corpora/omw-1.4.zip',
+}
+
+_ACTIVE_DIR = None
+
+def _sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def read_manifest(data_dir=NLTK_DATA_DIR):
+    path = os.path.join(data_dir, MANIFEST_FILE)
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def provision(data_dir=NLTK_DATA_DIR, source_dir=None, assets=REQUIRED_ASSETS):
+    """
+    One-time vaulting of the NLTK corpora into data_dir.
+    Copies the archives from a local nltk_data mirror (source_dir) or, on
+    connected machines, downloads them. Archives already pinned in the
+    manifest must match their recorded SHA-256; new ones are pinned.
+    """
+    manifest = read_manifest(data_dir)
+    for package, rel_path in assets.items():
+        target = os.path.join(data_dir, rel_path)
+        staged = target + '.part'
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        if source_dir:
+            shutil.copyfile(os.path.join(source_dir, rel_path), staged)
+        elif not os.path.exists(target):
+            import nltk
+            with tempfile.TemporaryDirectory() as scratch:
+                if not nltk.download(package, download_dir=scratch, quiet=True, raise_on_error=True):
+                    raise RuntimeError(f"NLTK download failed for '{package}'")
+                shutil.move(os.path.join(scratch, rel_path), staged)
+        else:
+            staged = target
+
+        # Vet the new archive before it replaces anything already in the vault
+        checksum = _sha256(staged)
+        pinned = manifest.get(package, {}).get('sha256')
+        if pinned and pinned != checksum:
+            os.remove(staged)
+            raise RuntimeError(f"Checksum mismatch for '{package}': expected {pinned}, got {checksum}")
+        os.replace(staged, target)
+        # Read straight from the verified archive, never from an unpacked copy
+        extracted = target[:-len('.zip')]
+        if os.path.isdir(extracted):
+            shutil.rmtree(extracted)
+        manifest[package] = {'path': rel_path, 'sha256': checksum, 'bytes': os.path.getsize(target)}
+        print(f"[VAULT] {package:<10} {checksum[:16]}  {rel_path}")
+
+    with open(os.path.join(data_dir, MANIFEST_FILE), 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    return manifest
+
+def verify(data_dir=NLTK_DATA_DIR, assets=REQUIRED_ASSETS):
+    """
+    Checks every required archive against the manifest.
+    Returns a list of problems; empty means the vault is intact.
+    """
+    manifest = read_manifest(data_dir)
+    if not manifest:
+        return [f"no {MANIFEST_FILE} in {data_dir}"]
+    problems = []
+    for package in assets:
+        entry = manifest.get(package)
+        if entry is None:
+            problems.append(f"'{package}' is not provisioned")
+            continue
+        path = os.path.join(data_dir, entry['path'])
+        if not os.path.exists(path):
+            problems.append(f"'{package}' archive missing at {path}")
+        elif _sha256(path) != entry['sha256']:
+            problems.append(f"'{package}' failed checksum verification")
+    return problems
+
+def activate(data_dir=NLTK_DATA_DIR):
+    """
+    Points NLTK at the vault and nowhere else.
+    Verifies checksums once per process and raises instead of downloading,
+    so startup never touches the network.
+    """
+    global _ACTIVE_DIR
+    import nltk
+    data_dir = os.path.abspath(data_dir)
+    if _ACTIVE_DIR != data_dir:
+        problems = verify(data_dir)
+        if problems:
+            raise RuntimeError(
+                "NLTK corpora are not provisioned: " + "; ".join(problems) +
+                ". Run `python provision_nltk.py` (add --source <nltk_data mirror> offline)."
+            )
+        _ACTIVE_DIR = data_dir
+    nltk.data.path[:] = [data_dir]
+    return data_dir
@@ -0,0 +1,225 @@
+import os
+import time
+import uuid
+import joblib
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.linear_model import SGDClassifier
+from sklearn.preprocessing import normalize
+from src.preprocessing import resolve_workers
+
+class AetherOnlineVectorizer:
+    """
+    Stateless hashed term counts with an optionally tracked, incrementally
+    updated smooth IDF. Exposes transform() so AetherPredictor can serve it
+    exactly like the batch TF-IDF vectorizer.
+    """
+    def __init__(self, n_features=2 ** 20, use_idf=True):
+        self.n_features = n_features
+        self.use_idf = use_idf
+        self.hasher = HashingVectorizer(
+            n_features=n_features, alternate_sign=False, norm=None, stop_words='english'
+        )
+        self.doc_freq = np.zeros(n_features, dtype=np.int64)
+        self.n_docs = 0
+        self._idf_diag = None
+
+    def __getstate__(self):
+        # The idf diagonal is derived from doc_freq; keep it out of checkpoints
+        state = self.__dict__.copy()
+        state['_idf_diag'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__dict__.setdefault('_idf_diag', None)
+
+    def partial_fit(self, texts):
+        counts = self.hasher.transform(texts)
+        self._observe(counts)
+        return self
+
+    def _observe(self, counts):
+        self.doc_freq += np.bincount(counts.indices, minlength=self.n_features)
+        self.n_docs += counts.shape[0]
+        self._idf_diag = None
+
+    def idf(self):
+        # Same smoothing as TfidfVectorizer(smooth_idf=True)
+        return np.log((1.0 + self.n_docs) / (1.0 + self.doc_freq)) + 1.0
+
+    def _weight(self, counts):
+        if self.use_idf:
+            if self._idf_diag is None:
+                self._idf_diag = sp.diags(self.idf(), format='csr')
+            counts = counts @ self._idf_diag
+        return normalize(counts, norm='l2', copy=False)
+
+    def transform(self, texts):
+        return self._weight(self.hasher.transform(texts))
+
+    def fit_transform_batch(self, texts):
+        """
+        Updates document frequencies with this batch, then weights it.
+        """
+        counts = self.hasher.transform(texts)
+        self._observe(counts)
+        return self._weight(counts)
+
+class AetherOnlineTrainer:
+    """
+    Out-of-core training for the Aether Sentinel.
+    Streams cleaned mini-batches through AetherOnlineVectorizer and an
+    SGD logistic model via partial_fit, checkpointing to models/ so new
+    labeled feeds can be folded in without retraining from scratch.
+    The checkpoint records how many rows of each source were absorbed, so
+    rerunning over an archive or feed only learns from rows appended since.
+    """
+    def __init__(self, model_path='models/online_model.pkl', vec_path='models/online_vectorizer.pkl',
+                 n_features=2 ** 20, use_idf=True, alpha=1e-5, checkpoint_every=10, seed=42):
+        self.model_path = model_path
+        self.vec_path = vec_path
+        self.checkpoint_every = checkpoint_every
+        self.vectorizer = AetherOnlineVectorizer(n_features=n_features, use_idf=use_idf)
+        self.model = SGDClassifier(loss='log_loss', alpha=alpha, random_state=seed)
+        self.classes = np.array([0, 1])
+        self.batches_seen = 0
+        self.samples_seen = 0
+        self.scored_seen = 0
+        self.correct_seen = 0
+        self.source_rows = {}
+
+    @classmethod
+    def resume(cls, model_path='models/online_model.pkl', vec_path='models/online_vectorizer.pkl', **kwargs):
+        """
+        Restores the latest checkpoint, or starts fresh if none exists.
+        """
+        trainer = cls(model_path=model_path, vec_path=vec_path, **kwargs)
+        if os.path.exists(model_path) and os.path.exists(vec_path):
+            trainer.model = joblib.load(model_path)
+            trainer.vectorizer = joblib.load(vec_path)
+            state = getattr(trainer.model, "aether_state_", {})
+            if state.get("checkpoint") != getattr(trainer.vectorizer, "aether_checkpoint_", None):
+                raise RuntimeError(
+                    f"Online checkpoint pair is inconsistent ({model_path} / {vec_path}); "
+                    "remove both files to retrain from scratch"
+                )
+            trainer.batches_seen = state.get("batches_seen", 0)
+            trainer.samples_seen = state.get("samples_seen", 0)
+            trainer.source_rows = dict(state.get("source_rows", {}))
+            print(f"[ONLINE] Resumed checkpoint ({trainer.samples_seen} samples seen)")
+        return trainer
+
+    def partial_fit(self, cleaned_texts, targets):
+        """
+        Folds one mini-batch of cleaned texts into the model.
+        Scores the batch before learning from it (progressive validation).
+        """
+        targets = np.asarray(targets)
+        X = self.vectorizer.fit_transform_batch(list(cleaned_texts))
+        if self.samples_seen:
+            self.correct_seen += int((self.model.predict(X) == targets).sum())
+            self.scored_seen += len(targets)
+        self.model.partial_fit(X, targets, classes=self.classes)
+        self.batches_seen += 1
+        self.samples_seen += len(targets)
+        if self.checkpoint_every and self.batches_seen % self.checkpoint_every == 0:
+            self.checkpoint()
+
+    def fit_stream(self, batches, preprocessor=None, n_jobs=1):
+        """
+        Trains over an iterable of DataFrames with 'total_text' and 'target'.
+        If a preprocessor is given, total_text is cleaned first (raw feeds);
+        otherwise it is assumed to be cleaned already (shards, corpus cache).
+        """
+        start_time = time.time()
+        workers = resolve_workers(n_jobs)
+        pool = preprocessor.worker_pool(workers) if preprocessor is not None else None
+        try:
+            for batch in batches:
+                if not len(batch):
+                    continue
+                texts = batch['total_text']
+                if preprocessor is not None:
+                    texts = preprocessor.clean_many(texts, n_jobs=workers, executor=pool)
+                self.partial_fit(texts, batch['target'])
+                rate = self.samples_seen / max(time.time() - start_time, 1e-9)
+                print(f"[ONLINE] Batch {self.batches_seen}: {self.samples_seen} samples ({rate:,.0f}/s)")
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        self.checkpoint()
+        return self.progressive_accuracy()
+
+    @staticmethod
+    def _source_key(path):
+        return os.path.abspath(path)
+
+    def absorbed_rows(self, path):
+        """
+        Rows of path already folded into the model by earlier runs.
+        """
+        return self.source_rows.get(self._source_key(path), 0)
+
+    def fold_in_csv(self, csv_path, preprocessor, chunksize=5000, n_jobs=1):
+        """
+        Folds the not-yet-absorbed rows of a labeled feed (title, text, target columns) into the model.
+        """
+        key, skip = self._source_key(csv_path), self.absorbed_rows(csv_path)
+        if skip:
+            print(f"[ONLINE] Skipping {skip} rows of {csv_path} absorbed by earlier runs")
+
+        def batches():
+            for chunk in pd.read_csv(csv_path, chunksize=chunksize, skiprows=range(1, skip + 1)):
+                chunk['total_text'] = chunk['title'].fillna('') + " " + chunk['text'].fillna('')
+                # Recorded before partial_fit, so any checkpoint holding this batch holds its offset too
+                self.source_rows[key] = self.source_rows.get(key, 0) + len(chunk)
+                yield chunk
+        return self.fit_stream(batches(), preprocessor=preprocessor, n_jobs=n_jobs)
+
+    def fold_in_archives(self, streamer, true_csv, fake_csv, n_jobs=1):
+        """
+        Streams the not-yet-absorbed rows of the True/Fake archives, mixed, through partial_fit.
+        """
+        keys = (self._source_key(true_csv), self._source_key(fake_csv))
+        skip = tuple(self.source_rows.get(k, 0) for k in keys)
+        if any(skip):
+            print(f"[ONLINE] Skipping {skip[0]} authentic / {skip[1]} fabricated rows absorbed by earlier runs")
+
+        def batches():
+            for chunk in streamer.iter_mixed_chunks(true_csv, fake_csv, skip=skip):
+                real = int((chunk['target'] == 1).sum())
+                self.source_rows[keys[0]] = self.source_rows.get(keys[0], 0) + real
+                self.source_rows[keys[1]] = self.source_rows.get(keys[1], 0) + len(chunk) - real
+                yield chunk
+        return self.fit_stream(batches(), preprocessor=streamer.preprocessor, n_jobs=n_jobs)
+
+    def progressive_accuracy(self):
+        return self.correct_seen / self.scored_seen if self.scored_seen else 0.0
+
+    def predict_proba(self, cleaned_texts):
+        return self.model.predict_proba(self.vectorizer.transform(list(cleaned_texts)))
+
+    def checkpoint(self):
+        """
+        Atomically archives model and vectorizer; loadable by AetherPredictor.from_artifacts.
+        """
+        os.makedirs(os.path.dirname(self.model_path) or '.', exist_ok=True)
+        # A shared id lets resume() detect a pair torn apart by a crash between the two renames
+        checkpoint_id = uuid.uuid4().hex
+        self.model.aether_state_ = {
+            "batches_seen": self.batches_seen,
+            "samples_seen": self.samples_seen,
+            "source_rows": dict(self.source_rows),
+            "checkpoint": checkpoint_id,
+        }
+        self.vectorizer.aether_checkpoint_ = checkpoint_id
+        pair = ((self.model, self.model_path), (self.vectorizer, self.vec_path))
+        # Both files are fully written before either replaces the live checkpoint
+        for obj, path in pair:
+            joblib.dump(obj, f"{path}.tmp")
+        for _, path in pair:
+            os.replace(f"{path}.tmp", path)
+        print(f"[ONLINE] Checkpoint archived to {self.model_path}")
@@ -0,0 +1,300 @@
+import functools
+import glob
+import json
+import os
+import random
+import threading
+import time
+
+PROFILE_DIR = "profiles"
+# Path fragments -> component, checked in order (TF-IDF lives inside sklearn)
+COMPONENTS = (
+    ("sklearn/feature_extraction", "TF-IDF"),
+    ("/nltk/", "NLTK"),
+    ("/shap/", "SHAP"),
+    ("/sklearn/", "sklearn"),
+    ("/scipy/", "sklearn"),
+    ("/streamlit/", "Streamlit"),
+    ("/pandas/", "pandas"),
+    ("/numpy/", "NumPy"),
+)
+
+def _env_flag(name, default=False):
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+def component_of(filename):
+    """
+    Maps a profiled function's source file to the stack component it belongs to.
+    """
+    path = filename.replace("\\", "/")
+    if path.startswith("<frozen importlib"):
+        return "imports"
+    for fragment, component in COMPONENTS:
+        if fragment in path:
+            return component
+    if "/src/" in path or path.endswith(("app.py", "train.py", "serve.py", "score.py")):
+        return "Aether"
+    return "other"
+
+def component_breakdown(stats):
+    """
+    Self time per component from a pstats.Stats. Time spent in C builtins
+    (regex, sparse kernels, ...) is charged to the components that called them.
+    """
+    totals = {}
+    for (filename, _, _), (_, _, tottime, _, callers) in stats.stats.items():
+        if filename != "~":
+            component = component_of(filename)
+            totals[component] = totals.get(component, 0.0) + tottime
+            continue
+        charged = 0.0
+        for (caller_file, _, _), caller_stats in callers.items():
+            component = component_of(caller_file) if caller_file != "~" else "other"
+            totals[component] = totals.get(component, 0.0) + caller_stats[2]
+            charged += caller_stats[2]
+        if tottime > charged:
+            totals["other"] = totals.get("other", 0.0) + tottime - charged
+    return {k: round(v * 1000, 3) for k, v in sorted(totals.items(), key=lambda kv: -kv[1])}
+
+class _NullSession:
+    """
+    Stand-in session used while profiling is off; every call is a no-op.
+    """
+    started = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def resume(self):
+        return self
+
+    def finish(self):
+        return None
+
+_NULL_SESSION = _NullSession()
+
+class AetherProfileSession:
+    """
+    One profiled request. Entering the session (possibly several times, e.g.
+    analysis then rendering) records into the same cProfile; finish() takes
+    the tracemalloc snapshot and writes the dump.
+    """
+    def __init__(self, profiler, label):
+        self.profiler = profiler
+        self.label = label
+        self.started = False
+        self.wall = 0.0
+        self._profile = None
+        self._entered_at = None
+        self._finished = False
+        # False once another session overlaps this one: the process-wide peak then covers both
+        self.peak_exact = True
+
+    def __enter__(self):
+        import cProfile
+        if self._finished or self.profiler._local.__dict__.get("session") is not None:
+            return self
+        if self._profile is None:
+            self._profile = cProfile.Profile()
+            self.profiler._tracemalloc_acquire(self)
+        try:
+            self._profile.enable()
+        except ValueError:
+            # Another profiler owns this interpreter (3.12+ allows only one)
+            return self
+        self.started = True
+        self.profiler._local.session = self
+        self._entered_at = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.profiler._local.__dict__.get("session") is self:
+            self._profile.disable()
+            self.wall += time.perf_counter() - self._entered_at
+            self.profiler._local.session = None
+        return False
+
+    def resume(self):
+        """
+        Context that extends the recording only if the session already started.
+        """
+        return self if self.started else _NULL_SESSION
+
+    def finish(self):
+        """
+        Writes the dump and returns its summary (None if nothing was recorded).
+        """
+        if self._finished:
+            return None
+        self._finished = True
+        if self._profile is None:
+            return None
+        snapshot, peak = self.profiler._tracemalloc_release(self)
+        if not self.started:
+            return None
+        return self.profiler._write(self, snapshot, peak)
+
+class AetherProfiler:
+    """
+    Opt-in per-request profiler for the scan path.
+    Enabled with AETHER_PROFILE=1 (or configure(enabled=True)). Each profiled
+    request writes a cProfile dump (.prof) and a JSON summary holding the time
+    per stack component, the hottest functions and the tracemalloc allocation
+    top-list into a rotating directory. When disabled, sessions and wrapped
+    methods cost a single flag check.
+    """
+    def __init__(self, enabled=None, out_dir=None, keep=None, sample_rate=None, top=25, trace_frames=1):
+        self.enabled = _env_flag("AETHER_PROFILE") if enabled is None else enabled
+        self.out_dir = out_dir or os.environ.get("AETHER_PROFILE_DIR", PROFILE_DIR)
+        self.keep = keep if keep is not None else int(os.environ.get("AETHER_PROFILE_KEEP", 50))
+        self.sample_rate = sample_rate if sample_rate is not None else float(os.environ.get("AETHER_PROFILE_SAMPLE", 1.0))
+        self.top = top
+        self.trace_frames = trace_frames
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._tracing = set()
+        self._owns_tracing = False
+
+    def configure(self, **settings):
+        for key, value in settings.items():
+            if not hasattr(self, key) or key.startswith("_"):
+                raise AttributeError(f"Unknown profiler setting '{key}'")
+            setattr(self, key, value)
+        return self
+
+    def session(self, label):
+        """
+        Returns a profiling session for one request (a no-op when disabled or not sampled).
+        """
+        if not self.enabled or (self.sample_rate < 1.0 and random.random() >= self.sample_rate):
+            return _NULL_SESSION
+        return AetherProfileSession(self, label)
+
+    def wrap(self, label):
+        """
+        Decorator profiling each call as its own request, unless the calling
+        thread is already inside a session (the outer request then covers it).
+        """
+        def decorator(fn):
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                if not self.enabled or self._local.__dict__.get("session") is not None:
+                    return fn(*args, **kwargs)
+                session = self.session(label)
+                try:
+                    with session:
+                        return fn(*args, **kwargs)
+                finally:
+                    session.finish()
+            return wrapper
+        return decorator
+
+    # --- tracemalloc is process-wide: trace while any session is open ---
+    def _tracemalloc_acquire(self, session):
+        import tracemalloc
+        with self._lock:
+            if not self._tracing and not tracemalloc.is_tracing():
+                tracemalloc.start(self.trace_frames)
+                self._owns_tracing = True
+            if not self._tracing:
+                tracemalloc.reset_peak()
+            else:
+                # Resetting would clobber the open sessions' peaks; all of them become approximate
+                session.peak_exact = False
+                for other in self._tracing:
+                    other.peak_exact = False
+            self._tracing.add(session)
+
+    def _tracemalloc_release(self, session):
+        import tracemalloc
+        with self._lock:
+            snapshot, peak = None, 0
+            if tracemalloc.is_tracing():
+                snapshot = tracemalloc.take_snapshot()
+                peak = tracemalloc.get_traced_memory()[1]
+            self._tracing.discard(session)
+            if not self._tracing and self._owns_tracing:
+                tracemalloc.stop()
+                self._owns_tracing = False
+        return snapshot, peak
+
+    def _write(self, session, snapshot, peak):
+        import pstats
+        import tracemalloc
+        os.makedirs(self.out_dir, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S") + f"-{int(time.time() * 1e6) % 1000000:06d}"
+        base = os.path.join(self.out_dir, f"{stamp}-{session.label}")
+        session._profile.dump_stats(f"{base}.prof")
+
+        stats = pstats.Stats(session._profile)
+        own_file = os.path.abspath(__file__)
+        hottest = sorted(
+            (kv for kv in stats.stats.items() if kv[0][0] != own_file),
+            key=lambda kv: kv[1][3], reverse=True
+        )[:self.top]
+        allocations = []
+        if snapshot is not None:
+            snapshot = snapshot.filter_traces((
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+                tracemalloc.Filter(False, "<unknown>"),
+            ))
+            allocations = [
+                {"location": f"{s.traceback[0].filename}:{s.traceback[0].lineno}",
+                 "size_kb": round(s.size / 1024, 1), "count": s.count}
+                for s in snapshot.statistics("lineno")[:self.top]
+            ]
+        summary = {
+            "label": session.label,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "wall_ms": round(session.wall * 1000, 3),
+            "peak_traced_kb": round(peak / 1024, 1),
+            "peak_exact": session.peak_exact,
+            "components_ms": component_breakdown(stats),
+            "top_functions": [
+                {"function": pstats.func_std_string(func), "component": component_of(func[0]),
+                 "calls": nc, "tottime_ms": round(tt * 1000, 3), "cumtime_ms": round(ct * 1000, 3)}
+                for func, (_, nc, tt, ct, _) in hottest
+            ],
+            "top_allocations": allocations,
+            "prof_file": f"{base}.prof",
+        }
+        with open(f"{base}.json", "w") as f:
+            json.dump(summary, f, indent=2)
+        self._rotate()
+        print(f"[PROFILE] {session.label}: {summary['wall_ms']:.1f}ms -> {base}.prof")
+        return summary
+
+    def _rotate(self):
+        summaries = sorted(glob.glob(os.path.join(self.out_dir, "*.json")))
+        for path in summaries[:max(0, len(summaries) - self.keep)]:
+            for stale in (path, path[:-5] + ".prof"):
+                try:
+                    os.remove(stale)
+                except OSError:
+                    pass
+
+    def recent(self, limit=20):
+        """
+        Summaries of the newest profiles on disk, newest first.
+        """
+        found = []
+        for path in sorted(glob.glob(os.path.join(self.out_dir, "*.json")), reverse=True)[:limit]:
+            try:
+                with open(path, "r") as f:
+                    found.append(json.load(f))
+            except (OSError, ValueError):
+                continue
+        return found
+
+    def latest(self):
+        recent = self.recent(limit=1)
+        return recent[0] if recent else None
+
+PROFILER = AetherProfiler()
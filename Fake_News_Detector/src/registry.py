@@ -0,0 +1,144 @@
+import os
+import threading
+import joblib
+from src.ann import make_search_backend
+from src.explain import AetherForensicExplainer
+from src.inference import AetherPredictor
+from src.metrics import METRICS, artifact_hash, load_eval_metrics
+from src.preprocessing import AetherDataProcessor
+
+class AetherModelRegistry:
+    """
+    Process-wide registry for the trained Aether artifacts.
+    Loads the model and vectorizer once and shares them across sessions,
+    reloading only when the artifact files actually change on disk.
+    search_backend picks the related-article search ('exact' or 'lsh');
+    it defaults to AETHER_SEARCH_BACKEND, else 'exact'. index_shards points
+    the related-article index at cleaned shards (train.py --chunksize)
+    instead of the raw archives; it defaults to AETHER_INDEX_SHARDS.
+    """
+    def __init__(self, model_path='models/model.pkl', vec_path='models/vectorizer.pkl', search_backend=None,
+                 index_shards=None):
+        self.model_path = model_path
+        self.vec_path = vec_path
+        self.search_backend = search_backend or os.environ.get("AETHER_SEARCH_BACKEND", "exact")
+        make_search_backend(self.search_backend)  # fail fast on a typo
+        self.index_shards = index_shards or os.environ.get("AETHER_INDEX_SHARDS") or None
+        self.metrics_path = os.path.join(os.path.dirname(model_path) or '.', 'metrics.json')
+        self.version = None
+        self._lock = threading.RLock()
+        self._stat = None
+        self._model = None
+        self._vectorizer = None
+        self._explainer = None
+        self._predictor = None
+        self._preprocessor = None
+        METRICS.register_collector("model", self.evaluation_stats)
+
+    def _stat_signature(self):
+        try:
+            return tuple(
+                (os.stat(p).st_mtime_ns, os.stat(p).st_size)
+                for p in (self.model_path, self.vec_path)
+            )
+        except OSError:
+            return None
+
+    def _content_hash(self):
+        return artifact_hash(self.model_path, self.vec_path)
+
+    def _refresh(self):
+        # Cheap stat check first; only hash (and reload) when mtime/size moved
+        signature = self._stat_signature()
+        if signature == self._stat:
+            return
+        with self._lock:
+            if signature == self._stat:
+                return
+            if signature is None:
+                self._model, self._vectorizer, self._explainer, self._predictor = None, None, None, None
+                self._stat, self.version = None, None
+                return
+            try:
+                content_hash = self._content_hash()
+                if content_hash != self.version:
+                    model = joblib.load(self.model_path)
+                    vectorizer = joblib.load(self.vec_path)
+                    self._model, self._vectorizer = model, vectorizer
+                    self._explainer, self._predictor = None, None
+                    self.version = content_hash
+                    print(f"[REGISTRY] Artifacts loaded (version {content_hash[:12]})")
+                self._stat = signature
+            except Exception as e:
+                print(f"[ERROR] Artifact load failure: {e}")
+                self._model, self._vectorizer, self._explainer, self._predictor = None, None, None, None
+                self._stat, self.version = None, None
+
+    def load(self):
+        """
+        Returns the current (model, vectorizer) pair, or (None, None) if unavailable.
+        """
+        self._refresh()
+        with self._lock:
+            return self._model, self._vectorizer
+
+    def get_explainer(self):
+        """
+        Returns the shared forensic explainer for the current artifact version.
+        """
+        self._refresh()
+        with self._lock:
+            if self._model is None:
+                return None
+            if self._explainer is None:
+                from src.index import AetherSimilarityIndex
+                index = AetherSimilarityIndex(
+                    self._vectorizer, backend=make_search_backend(self.search_backend), shard_dir=self.index_shards
+                )
+                self._explainer = AetherForensicExplainer(self._model, self._vectorizer, related_index=index)
+            return self._explainer
+
+    def get_preprocessor(self):
+        """
+        Returns the process-wide text preprocessor (independent of artifact version).
+        """
+        with self._lock:
+            if self._preprocessor is None:
+                self._preprocessor = AetherDataProcessor()
+                METRICS.register_collector("lemma_cache", self._preprocessor.lemma_cache.stats)
+            return self._preprocessor
+
+    def get_predictor(self):
+        """
+        Returns the shared inference-only predictor for the current artifact version.
+        """
+        self._refresh()
+        with self._lock:
+            if self._model is None:
+                return None
+            if self._predictor is None:
+                self._predictor = AetherPredictor(self._model, self._vectorizer, self.get_preprocessor())
+            return self._predictor
+
+    def evaluation(self):
+        """
+        Returns the held-out evaluation saved by the last training run, or None.
+        'stale' is True unless it was recorded for the artifacts currently loaded.
+        """
+        evaluation = load_eval_metrics(self.metrics_path)
+        if evaluation is None:
+            return None
+        self._refresh()
+        evaluation["stale"] = self.version is None or evaluation.get("artifact_hash") != self.version
+        return evaluation
+
+    def evaluation_stats(self):
+        # Numeric evaluation figures as a metrics collector; a stale evaluation exposes only the flag
+        evaluation = self.evaluation()
+        if evaluation is None:
+            return {}
+        if evaluation["stale"]:
+            return {"evaluation_stale": 1}
+        stats = {k: v for k, v in evaluation.items() if isinstance(v, (int, float)) and not isinstance(v, bool)}
+        stats["evaluation_stale"] = 0
+        return stats
@@ -0,0 +1,225 @@
+import glob
+import json
+import os
+import time
+import pandas as pd
+from src.audit import AUDIT_FLAGS
+from src.corpus_cache import AetherCorpusCache
+from src.preprocessing import resolve_workers
+from src.registry import AetherModelRegistry
+
+INPUT_PATTERNS = ("*.csv", "*.csv.gz", "*.jsonl", "*.jsonl.gz", "*.ndjson")
+OUTPUT_FORMATS = ("csv", "jsonl", "parquet")
+AUDIT_COLUMNS = ["assessment", "sensationalism", "urgency", "speculation", *AUDIT_FLAGS]
+
+def discover_inputs(paths):
+    """
+    Expands files and directories (searched recursively) into a sorted, de-duplicated input list.
+    """
+    found = []
+    for path in paths:
+        if os.path.isdir(path):
+            for pattern in INPUT_PATTERNS:
+                found.extend(glob.glob(os.path.join(path, "**", pattern), recursive=True))
+        elif os.path.exists(path):
+            found.append(path)
+        else:
+            raise FileNotFoundError(f"No such input: {path}")
+    return sorted(set(os.path.abspath(p) for p in found))
+
+def infer_format(output_path, fmt=None):
+    fmt = fmt or output_path.rsplit(".", 1)[-1].lower()
+    if fmt not in OUTPUT_FORMATS:
+        raise ValueError(f"Unsupported output format '{fmt}' (expected one of {', '.join(OUTPUT_FORMATS)})")
+    return fmt
+
+class AetherResultWriter:
+    """
+    Incremental sink for scored chunks.
+    CSV and JSONL append to one file; Parquet writes one part file per chunk
+    into a directory. offset() marks a durable point that truncate() can roll
+    back to, so a resumed run never duplicates rows.
+    """
+    def __init__(self, path, fmt):
+        self.path = path
+        self.fmt = fmt
+        if fmt == "parquet":
+            os.makedirs(path, exist_ok=True)
+        elif os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    def offset(self):
+        if self.fmt == "parquet":
+            return len(glob.glob(os.path.join(self.path, "part-*.parquet")))
+        return os.path.getsize(self.path) if os.path.exists(self.path) else 0
+
+    def truncate(self, offset):
+        if self.fmt == "parquet":
+            for part in glob.glob(os.path.join(self.path, "part-*.parquet")):
+                if int(os.path.basename(part)[5:10]) >= offset:
+                    os.remove(part)
+        elif os.path.exists(self.path):
+            with open(self.path, "r+b") as f:
+                f.truncate(offset)
+
+    def write(self, df):
+        if self.fmt == "parquet":
+            df.to_parquet(os.path.join(self.path, f"part-{self.offset():05d}.parquet"), index=False)
+            return
+        with open(self.path, "a", encoding="utf-8", newline="") as f:
+            if self.fmt == "csv":
+                df.to_csv(f, index=False, header=f.tell() == 0)
+            else:
+                df.to_json(f, orient="records", lines=True, force_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+
+class AetherBatchScorer:
+    """
+    Offline bulk scoring for CSV/JSONL dumps.
+    Streams each input in chunks, fans cleaning out across a process pool,
+    scores every chunk with one sparse predict_proba call, optionally adds
+    the linguistic audit and top archive matches, and appends the results.
+    Progress is checkpointed per chunk next to the output, so an interrupted
+    run resumes where it stopped.
+    """
+    def __init__(self, registry=None, n_jobs=1, chunksize=5000, text_column=None,
+                 id_column=None, audit=False, related=0):
+        self.registry = registry or AetherModelRegistry()
+        self.n_jobs = n_jobs
+        self.chunksize = chunksize
+        self.text_column = text_column
+        self.id_column = id_column
+        self.audit = audit
+        self.related = related
+        self._archive = None
+
+    def iter_chunks(self, path):
+        """
+        Yields raw chunks of an input file (CSV or JSON Lines, optionally gzipped).
+        """
+        name = path[:-3] if path.endswith(".gz") else path
+        if name.endswith((".jsonl", ".ndjson")):
+            reader = pd.read_json(path, lines=True, chunksize=self.chunksize, dtype=False)
+        else:
+            reader = pd.read_csv(path, chunksize=self.chunksize)
+        with reader:
+            yield from reader
+
+    def extract_text(self, chunk):
+        if self.text_column:
+            if self.text_column not in chunk:
+                raise KeyError(f"Text column '{self.text_column}' not found")
+            return chunk[self.text_column].fillna('').astype(str)
+        if 'title' in chunk and 'text' in chunk:
+            # Same total_text construction the engine was trained on
+            return chunk['title'].fillna('').astype(str) + " " + chunk['text'].fillna('').astype(str)
+        for column in ('text', 'content', 'body', 'total_text'):
+            if column in chunk:
+                return chunk[column].fillna('').astype(str)
+        raise KeyError("No text column found; pass --text-column")
+
+    def _related_frame(self):
+        if self._archive is None:
+            self._archive = AetherCorpusCache().load_archive()
+            if self._archive is None:
+                raise FileNotFoundError("Related-article lookup needs the news archive in data/raw/")
+        return self._archive
+
+    def score_chunk(self, chunk, source, start_row, pool=None, workers=1):
+        """
+        Scores one raw chunk and returns the result frame.
+        """
+        texts = self.extract_text(chunk).tolist()
+        predictor = self.registry.get_predictor()
+        if predictor is None:
+            raise RuntimeError("Neural engine unavailable; run train.py first")
+        cleaned = predictor.preprocessor.clean_many(
+            texts, n_jobs=workers, executor=pool, chunk_size=max(1, -(-len(texts) // workers))
+        )
+        probs = predictor.predict_cleaned(cleaned)
+
+        out = pd.DataFrame({
+            "source": source,
+            "row": range(start_row, start_row + len(texts)),
+        })
+        if self.id_column:
+            out["id"] = chunk[self.id_column].to_numpy()
+        out["label"] = ["REAL" if p > 0.5 else "FAKE" for p in probs[:, 1]]
+        out["prob_fake"] = probs[:, 0]
+        out["prob_real"] = probs[:, 1]
+
+        if self.audit or self.related:
+            explainer = self.registry.get_explainer()
+        if self.audit:
+            audit = explainer.get_linguistic_audit_batch(texts)
+            out = pd.concat([out, audit[AUDIT_COLUMNS].reset_index(drop=True)], axis=1)
+        if self.related:
+            archive = self._related_frame()
+            matches = [explainer.get_related_intel(t, archive)[:self.related] for t in texts]
+            out["related"] = [
+                json.dumps([{k: m[k] for k in ("title", "label", "similarity")} for m in found], ensure_ascii=False)
+                for found in matches
+            ]
+        return out
+
+    def run(self, inputs, output, fmt=None, resume=False):
+        """
+        Scores every input file into output and returns the number of documents scored.
+        """
+        fmt = infer_format(output, fmt)
+        files = discover_inputs(inputs)
+        writer = AetherResultWriter(output, fmt)
+        progress_path = f"{output.rstrip('/')}.progress.json"
+        self.registry.load()
+        version = self.registry.version
+
+        progress = {"version": version, "files": {}, "offset": 0}
+        if resume and os.path.exists(progress_path):
+            with open(progress_path, "r") as f:
+                progress = json.load(f)
+            if progress.get("version") != version:
+                raise RuntimeError("Model artifacts changed since this run started; rerun without --resume")
+            writer.truncate(progress["offset"])
+            print(f"[SCORE] Resuming: {sum(s['rows'] for s in progress['files'].values())} documents already scored")
+        else:
+            writer.truncate(0)
+
+        def checkpoint():
+            progress["offset"] = writer.offset()
+            tmp_path = f"{progress_path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(progress, f, indent=2)
+            os.replace(tmp_path, progress_path)
+
+        workers = resolve_workers(self.n_jobs)
+        pool = self.registry.get_preprocessor().worker_pool(workers)
+        scored, start_time = 0, time.time()
+        try:
+            for path in files:
+                state = progress["files"].setdefault(path, {"rows": 0, "done": False})
+                if state["done"]:
+                    continue
+                seen = 0
+                for chunk in self.iter_chunks(path):
+                    # Rows checkpointed by an earlier run are skipped, whatever its chunk size was
+                    skip = max(0, min(len(chunk), state["rows"] - seen))
+                    seen += len(chunk)
+                    chunk = chunk.iloc[skip:]
+                    if chunk.empty:
+                        continue
+                    writer.write(self.score_chunk(chunk, path, seen - len(chunk), pool, workers))
+                    state["rows"] = seen
+                    scored += len(chunk)
+                    checkpoint()
+                    elapsed = time.time() - start_time
+                    print(f"[SCORE] {os.path.basename(path)}: {seen} rows | {scored / max(elapsed, 1e-9):,.0f} docs/sec")
+                state["done"] = True
+                checkpoint()
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        elapsed = time.time() - start_time
+        print(f"[SCORE] {scored} documents in {elapsed:.2f}s ({scored / max(elapsed, 1e-9):,.0f} docs/sec) -> {output}")
+        return scored
@@ -0,0 +1,356 @@
+import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from src.corpus_cache import AetherCorpusCache
+from src.metrics import METRICS, PROMETHEUS_CONTENT_TYPE
+from src.registry import AetherModelRegistry
+
+REASONS = {
+    200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+    413: "Payload Too Large", 500: "Internal Server Error", 501: "Not Implemented",
+    503: "Service Unavailable",
+}
+
+class AetherRequestError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+class AetherMicroBatcher:
+    """
+    Coalesces concurrent scan requests into micro-batches.
+    The first queued text opens a batch; it closes after max_wait_ms or at
+    max_batch_size texts, and the whole batch goes through one sparse
+    vectorize + predict_proba call on a dedicated scoring thread. While a
+    batch scores, the next one fills, so batches grow with load.
+    """
+    def __init__(self, score_batch, max_batch_size=64, max_wait_ms=5.0):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be >= 1")
+        self.score_batch = score_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.batches = 0
+        self.items = 0
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="aether-score")
+        self._queue = None
+        self._task = None
+
+    def start(self):
+        self._queue = asyncio.Queue()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._executor.shutdown(wait=False)
+
+    async def submit(self, texts):
+        """
+        Queues texts for scoring and returns their probability rows in order.
+        """
+        loop = asyncio.get_running_loop()
+        futures = [loop.create_future() for _ in texts]
+        for text, future in zip(texts, futures):
+            self._queue.put_nowait((text, future))
+        return await asyncio.gather(*futures)
+
+    async def _collect(self):
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect()
+            # Requests whose clients went away are dropped before scoring
+            batch = [(text, future) for text, future in batch if not future.done()]
+            if not batch:
+                continue
+            try:
+                probs = await loop.run_in_executor(self._executor, self.score_batch, [t for t, _ in batch])
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            self.batches += 1
+            self.items += len(batch)
+            for (_, future), row in zip(batch, probs):
+                if not future.done():
+                    future.set_result(row)
+
+class AetherInferenceService:
+    """
+    Standalone asyncio HTTP front-end for the Aether Sentinel.
+    Serves JSON scans, audits and archive matches over HTTP/1.1 keep-alive
+    using only the standard library, with liveness (/health) and readiness
+    (/ready) probes for orchestrators.
+    """
+    def __init__(self, registry=None, host='127.0.0.1', port=8000, max_batch_size=64,
+                 max_wait_ms=5.0, max_body_bytes=8 * 1024 * 1024, corpus_cache=None):
+        self.registry = registry or AetherModelRegistry()
+        self.host = host
+        self.port = port
+        self.max_body_bytes = max_body_bytes
+        self.corpus_cache = corpus_cache or AetherCorpusCache()
+        self.batcher = AetherMicroBatcher(self._score_batch, max_batch_size, max_wait_ms)
+        self.ready = False
+        self.ready_error = "warming up"
+        self._archive = None
+        self._archive_key = None
+        self._archive_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="aether-http")
+        self._server = None
+        self.routes = {
+            '/health': ('GET', self.handle_health),
+            '/ready': ('GET', self.handle_ready),
+            '/predict': ('POST', self.handle_predict),
+            '/predict_batch': ('POST', self.handle_predict_batch),
+            '/audit': ('POST', self.handle_audit),
+            '/related': ('POST', self.handle_related),
+            '/metrics': ('GET', self.handle_metrics),
+        }
+        METRICS.register_collector("batcher", self._batcher_stats)
+
+    # --- Engine access ---
+    def _score_batch(self, texts):
+        predictor = self.registry.get_predictor()
+        if predictor is None:
+            raise AetherRequestError(503, "Neural engine unavailable.")
+        return predictor.predict_many(texts, batch_size=self.batcher.max_batch_size)
+
+    def _warm_up(self):
+        # Loads artifacts, the NLTK vault and the explainer before traffic is admitted
+        try:
+            self._score_batch(["Aether warm-up signal."])
+            self.registry.get_explainer()
+            self.ready, self.ready_error = True, None
+            print(f"[SERVICE] Ready (artifact version {self.registry.version[:12]})")
+        except Exception as e:
+            self.ready, self.ready_error = False, str(e)
+            print(f"[ERROR] Warm-up failed: {e}")
+
+    def _load_archive(self):
+        key = self.corpus_cache.key()
+        with self._archive_lock:
+            if key != self._archive_key:
+                self._archive = self.corpus_cache.load_archive() if key else None
+                self._archive_key = key
+            return self._archive
+
+    def _related(self, text):
+        explainer = self._explainer()
+        dataset = self._load_archive()
+        if dataset is None:
+            raise AetherRequestError(503, "News archive unavailable.")
+        return explainer.get_related_intel(text, dataset)
+
+    def _audit(self, text):
+        return self._explainer().get_linguistic_audit(text)
+
+    def _explainer(self):
+        explainer = self.registry.get_explainer()
+        if explainer is None:
+            raise AetherRequestError(503, "Neural engine unavailable.")
+        return explainer
+
+    @staticmethod
+    def _verdict(probs):
+        fake, real = float(probs[0]), float(probs[1])
+        return {
+            "label": "REAL" if real > 0.5 else "FAKE",
+            "confidence": max(fake, real),
+            "probabilities": {"fake": fake, "real": real},
+        }
+
+    @staticmethod
+    def _text_field(payload):
+        text = payload.get("text")
+        if not isinstance(text, str) or not text.strip():
+            raise AetherRequestError(400, "'text' must be a non-empty string.")
+        return text
+
+    def _batcher_stats(self):
+        return {
+            "batches": self.batcher.batches,
+            "items": self.batcher.items,
+            "mean_batch_size": self.batcher.items / self.batcher.batches if self.batcher.batches else 0.0,
+        }
+
+    def _require_ready(self):
+        if not self.ready:
+            raise AetherRequestError(503, f"Sentinel not ready: {self.ready_error}")
+
+    # --- Endpoints ---
+    async def handle_health(self, payload):
+        return 200, {"status": "alive"}
+
+    async def handle_ready(self, payload):
+        if not self.ready:
+            return 503, {"status": "not_ready", "reason": self.ready_error}
+        return 200, {
+            "status": "ready",
+            "version": self.registry.version,
+            "batches": self.batcher.batches,
+            "batched_items": self.batcher.items,
+        }
+
+    async def handle_metrics(self, payload):
+        # Plain-text Prometheus exposition; every other endpoint answers JSON
+        return 200, METRICS.render_prometheus()
+
+    async def handle_predict(self, payload):
+        self._require_ready()
+        text = self._text_field(payload)
+        probs, = await self.batcher.submit([text])
+        return 200, dict(self._verdict(probs), version=self.registry.version)
+
+    async def handle_predict_batch(self, payload):
+        self._require_ready()
+        texts = payload.get("texts")
+        if not isinstance(texts, list) or not all(isinstance(t, str) for t in texts):
+            raise AetherRequestError(400, "'texts' must be a list of strings.")
+        rows = await self.batcher.submit(texts)
+        return 200, {"results": [self._verdict(p) for p in rows], "version": self.registry.version}
+
+    async def handle_audit(self, payload):
+        self._require_ready()
+        text = self._text_field(payload)
+        # The audit is CPU-bound; like prediction it stays off the event loop
+        loop = asyncio.get_running_loop()
+        return 200, await loop.run_in_executor(self._executor, self._audit, text)
+
+    async def handle_related(self, payload):
+        self._require_ready()
+        text = self._text_field(payload)
+        loop = asyncio.get_running_loop()
+        matches = await loop.run_in_executor(self._executor, self._related, text)
+        return 200, {"matches": matches}
+
+    # --- HTTP/1.1 plumbing ---
+    async def _read_request(self, reader):
+        request_line = await reader.readline()
+        if not request_line:
+            return None
+        try:
+            method, target, version = request_line.decode('latin-1').split()
+        except ValueError:
+            raise AetherRequestError(400, "Malformed request line.")
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+            if len(headers) > 100:
+                raise AetherRequestError(400, "Too many headers.")
+        if headers.get('transfer-encoding', 'identity').lower() != 'identity':
+            raise AetherRequestError(501, "Transfer-Encoding is not supported; send a Content-Length body.")
+        raw_length = headers.get('content-length') or '0'
+        # isascii() guards against latin-1 digits such as '²' that isdigit() accepts but int() rejects
+        if not (raw_length.isascii() and raw_length.isdigit()):
+            raise AetherRequestError(400, "Malformed Content-Length.")
+        length = int(raw_length)
+        if length > self.max_body_bytes:
+            raise AetherRequestError(413, f"Body exceeds {self.max_body_bytes} bytes.")
+        body = await reader.readexactly(length) if length else b''
+        keep_alive = headers.get('connection', '').lower() != 'close' and version == 'HTTP/1.1'
+        return method.upper(), target.split('?', 1)[0], body, keep_alive
+
+    async def _dispatch(self, method, path, body):
+        route = self.routes.get(path)
+        if route is None:
+            raise AetherRequestError(404, f"No endpoint at {path}.")
+        allowed, handler = route
+        if method != allowed:
+            raise AetherRequestError(405, f"{path} expects {allowed}.")
+        payload = {}
+        if body:
+            try:
+                payload = json.loads(body)
+            except ValueError:
+                raise AetherRequestError(400, "Body is not valid JSON.")
+            if not isinstance(payload, dict):
+                raise AetherRequestError(400, "Body must be a JSON object.")
+        return await handler(payload)
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            while True:
+                keep_alive = False
+                try:
+                    request = await self._read_request(reader)
+                    if request is None:
+                        break
+                    method, path, body, keep_alive = request
+                    status, result = await self._dispatch(method, path, body)
+                except AetherRequestError as e:
+                    status, result = e.status, {"error": str(e)}
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except Exception as e:
+                    print(f"[ERROR] Request failure: {e}")
+                    status, result = 500, {"error": "Internal sentinel failure."}
+                METRICS.inc("http_requests")
+                if status >= 500:
+                    METRICS.inc("http_errors")
+                if isinstance(result, str):
+                    payload, content_type = result.encode('utf-8'), PROMETHEUS_CONTENT_TYPE
+                else:
+                    payload, content_type = json.dumps(result).encode('utf-8'), "application/json"
+                writer.write(
+                    f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                    f"Content-Type: {content_type}\r\n"
+                    f"Content-Length: {len(payload)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode('latin-1') + payload
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def start(self):
+        self.batcher.start()
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        print(f"[SERVICE] Listening on http://{self.host}:{self.port}")
+        # Liveness answers immediately; readiness flips once the engine is warm
+        asyncio.get_running_loop().run_in_executor(self._executor, self._warm_up)
+        return self
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        await self.batcher.stop()
+        self._executor.shutdown(wait=False)
+
+    async def serve_forever(self):
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.stop()
@@ -1,90 +1,147 @@
-import pandas as pd
-import joblib
-from sklearn.model_selection import train_test_split
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.linear_model import LogisticRegression
-from sklearn.metrics import classification_report, confusion_matrix, accuracy_score, roc_auc_score
-from src.preprocessing import AetherDataProcessor
-import os
-import time
-
-class AetherNeuralEngine:
-    """
-    Core Machine Learning Engine for the Aether Sentinel.
-    Handles semantic vectorization and high-performance classification.
-    """
-    def __init__(self, model_path='models/model.pkl', vec_path='models/vectorizer.pkl'):
-        self.model_path = model_path
-        self.vec_path = vec_path
-        # Optimized TF-IDF for high-dimensional semantic extraction
-        self.vectorizer = TfidfVectorizer(
-            max_features=5000, 
-            ngram_range=(1, 1), 
-            stop_words='english'
-        )
-        self.model = LogisticRegression(max_iter=2000, C=0.1, n_jobs=-1, solver='saga', class_weight='balanced')
-        self.preprocessor = AetherDataProcessor()
-
-    def prepare_data(self, true_csv, fake_csv):
-        """
-        Synchronizes raw data into a unified neural archive.
-        """
-        print("[DATA_SYNC] Accessing primary archives...")
-        df_true = pd.read_csv(true_csv)
-        df_fake = pd.read_csv(fake_csv)
-        df_true['target'] = 1  
-        df_fake['target'] = 0  
-        
-        df = pd.concat([df_true, df_fake]).reset_index(drop=True)
-        df['total_text'] = df['title'].fillna('') + " " + df['text'].fillna('')
-        
-        print(f"[DATA_SYNC] Cleaning {len(df)} records for neural ingestion...")
-        start_time = time.time()
-        df['total_text'] = df['total_text'].apply(self.preprocessor.clean_text)
-        print(f"[DATA_SYNC] Normalization complete in {time.time() - start_time:.2f}s")
-        return df
-
-    def train(self, df):
-        """
-        Calibrates neural weights based on the provided dataset.
-        """
-        X_train, X_test, y_train, y_test = train_test_split(
-            df['total_text'], df['target'], test_size=0.15, random_state=44
-        )
-        
-        print("[TRAIN_INIT] Identifying semantic vectors...")
-        X_train_tfidf = self.vectorizer.fit_transform(X_train)
-        X_test_tfidf = self.vectorizer.transform(X_test)
-        
-        print("[TRAIN_INIT] Calibrating weight matrices...")
-        start_time = time.time()
-        self.model.fit(X_train_tfidf, y_train)
-        print(f"[TRAIN_INIT] Calibration finished in {time.time() - start_time:.2f}s")
-        
-        # Performance Verification
-        y_pred = self.model.predict(X_test_tfidf)
-        y_prob = self.model.predict_proba(X_test_tfidf)[:, 1]
-        
-        metrics = {
-            "accuracy": accuracy_score(y_test, y_pred),
-            "roc_auc": roc_auc_score(y_test, y_prob),
-            "report": classification_report(y_test, y_pred),
-            "cm": confusion_matrix(y_test, y_pred)
-        }
-        
-        # Archiving Core
-        os.makedirs('models', exist_ok=True)
-        joblib.dump(self.model, self.model_path)
-        joblib.dump(self.vectorizer, self.vec_path)
-        print(f"[SYSTEM] Neural model archived to {self.model_path}")
-        
-        return metrics
-
-    def predict(self, raw_text):
-        """
-        Runs a single text trace through the calibrated engine.
-        """
-        cleaned = self.preprocessor.clean_text(raw_text)
-        vec = self.vectorizer.transform([cleaned])
-        prob = self.model.predict_proba(vec)[0]
-        return prob
+import pandas as pd
+import joblib
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+from src.preprocessing import AetherDataProcessor
+from src.inference import AetherPredictor
+from src.ingest import AetherCorpusStreamer, load_shards
+from src.corpus_cache import AetherCorpusCache
+from src.metrics import artifact_hash, save_eval_metrics
+import os
+import time
+
+class AetherNeuralEngine(AetherPredictor):
+    """
+    Core Machine Learning Engine for the Aether Sentinel.
+    Handles semantic vectorization and high-performance classification.
+    """
+    def __init__(self, model_path='models/model.pkl', vec_path='models/vectorizer.pkl', lemma_cache_path=None):
+        self.model_path = model_path
+        self.vec_path = vec_path
+        self.metrics_path = os.path.join(os.path.dirname(model_path) or '.', 'metrics.json')
+        # Optimized TF-IDF for high-dimensional semantic extraction
+        self.vectorizer = TfidfVectorizer(
+            max_features=5000, 
+            ngram_range=(1, 1), 
+            stop_words='english'
+        )
+        self.model = LogisticRegression(max_iter=2000, C=0.1, n_jobs=-1, solver='saga', class_weight='balanced')
+        self.preprocessor = AetherDataProcessor(lemma_cache_path=lemma_cache_path)
+
+    @classmethod
+    def from_artifacts(cls, model_path='models/model.pkl', vec_path='models/vectorizer.pkl', preprocessor=None):
+        """
+        Restores a trained engine from its archived artifacts, bound to the same paths.
+        """
+        engine = cls(model_path, vec_path)
+        engine.model = joblib.load(model_path)
+        engine.vectorizer = joblib.load(vec_path)
+        if preprocessor is not None:
+            engine.preprocessor = preprocessor
+        return engine
+
+    def prepare_data(self, true_csv, fake_csv, n_jobs=1, chunksize=None, shard_dir='data/shards', use_cache=True):
+        """
+        Synchronizes raw data into a unified neural archive.
+        n_jobs > 1 (or -1 for all cores) cleans the corpus in a process pool.
+        chunksize streams the archives through cleaned shards in shard_dir
+        instead of loading them whole, keeping only total_text/target in memory.
+        use_cache reuses the preprocessed Parquet corpus when the raw files and
+        preprocessing version are unchanged.
+        """
+        corpus_cache = AetherCorpusCache((true_csv, fake_csv)) if use_cache and not chunksize else None
+        if corpus_cache is not None:
+            start_time = time.time()
+            df = corpus_cache.load()
+            if df is not None:
+                print(f"[DATA_SYNC] Preprocessed corpus cache hit: {len(df)} records in {time.time() - start_time:.2f}s")
+                return df
+
+        if chunksize:
+            print(f"[DATA_SYNC] Streaming archives in chunks of {chunksize}...")
+            streamer = AetherCorpusStreamer(self.preprocessor, chunksize=chunksize, n_jobs=n_jobs)
+            streamer.write_shards(true_csv, fake_csv, out_dir=shard_dir)
+            return load_shards(shard_dir)
+
+        print("[DATA_SYNC] Accessing primary archives...")
+        start_time = time.time()
+        df_true = pd.read_csv(true_csv)
+        df_fake = pd.read_csv(fake_csv)
+        df_true['target'] = 1  
+        df_fake['target'] = 0  
+        
+        df = pd.concat([df_true, df_fake]).reset_index(drop=True)
+        df['total_text'] = df['title'].fillna('') + " " + df['text'].fillna('')
+        print(f"[DATA_SYNC] Archives loaded in {time.time() - start_time:.2f}s")
+        
+        print(f"[DATA_SYNC] Cleaning {len(df)} records for neural ingestion...")
+        start_time = time.time()
+        df['total_text'] = self.preprocessor.clean_many(df['total_text'], n_jobs=n_jobs)
+        # clean_many caps workers by chunk count, so report what it used rather than n_jobs
+        workers = self.preprocessor.last_workers
+        print(f"[DATA_SYNC] Normalization complete in {time.time() - start_time:.2f}s ({workers} worker(s))")
+        stats = self.preprocessor.lemma_cache.stats()
+        print(f"[DATA_SYNC] Lemma cache: {stats['hits']} hits / {stats['misses']} misses ({stats['hit_rate']:.1%})")
+        self.preprocessor.lemma_cache.save()
+        if corpus_cache is not None and corpus_cache.save(df):
+            print("[DATA_SYNC] Preprocessed corpus cached for future runs")
+        return df
+
+    def train(self, df):
+        """
+        Calibrates neural weights based on the provided dataset.
+        """
+        # Evaluation tooling is only needed here, not for inference
+        from sklearn.model_selection import train_test_split
+        from sklearn.metrics import (
+            classification_report, confusion_matrix, accuracy_score, roc_auc_score, precision_recall_fscore_support
+        )
+        
+        X_train, X_test, y_train, y_test = train_test_split(
+            df['total_text'], df['target'], test_size=0.15, random_state=44
+        )
+        
+        print("[TRAIN_INIT] Identifying semantic vectors...")
+        X_train_tfidf = self.vectorizer.fit_transform(X_train)
+        X_test_tfidf = self.vectorizer.transform(X_test)
+        
+        print("[TRAIN_INIT] Calibrating weight matrices...")
+        start_time = time.time()
+        self.model.fit(X_train_tfidf, y_train)
+        print(f"[TRAIN_INIT] Calibration finished in {time.time() - start_time:.2f}s")
+        
+        # Performance Verification
+        y_pred = self.model.predict(X_test_tfidf)
+        y_prob = self.model.predict_proba(X_test_tfidf)[:, 1]
+        
+        metrics = {
+            "accuracy": accuracy_score(y_test, y_pred),
+            "roc_auc": roc_auc_score(y_test, y_prob),
+            "report": classification_report(y_test, y_pred),
+            "cm": confusion_matrix(y_test, y_pred)
+        }
+        
+        # Archiving Core
+        os.makedirs('models', exist_ok=True)
+        joblib.dump(self.model, self.model_path)
+        joblib.dump(self.vectorizer, self.vec_path)
+        print(f"[SYSTEM] Neural model archived to {self.model_path}")
+
+        # Evaluation travels with the artifacts so System Health reports measured numbers
+        precision, recall, f1, _ = precision_recall_fscore_support(y_test, y_pred, average='macro', zero_division=0)
+        save_eval_metrics({
+            "accuracy": float(metrics["accuracy"]),
+            "roc_auc": float(metrics["roc_auc"]),
+            "precision": float(precision),
+            "recall": float(recall),
+            "f1": float(f1),
+            "confusion_matrix": metrics["cm"].tolist(),
+            "train_samples": int(len(y_train)),
+            "test_samples": int(len(y_test)),
+            "corpus_size": int(len(df)),
+            "trained_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            # Lets the registry tell whether these figures describe the artifacts it serves
+            "artifact_hash": artifact_hash(self.model_path, self.vec_path),
+        }, self.metrics_path)
+        
+        return metrics
@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+import scipy.sparse as sp
+from sklearn.preprocessing import normalize
+from src.ann import AetherExactSearch, AetherLSHSearch, make_search_backend
+
+@pytest.fixture
+def archive():
+    matrix = sp.random(300, 64, density=0.2, format='csr', random_state=np.random.default_rng(7))
+    return normalize(matrix)
+
+def test_narrow_buckets_fall_back_to_exact_search(archive):
+    query = archive[17]
+    # 63 bits in one unprobed table: buckets are near-singletons, so recall is too low for k=5
+    lsh = AetherLSHSearch(n_tables=1, n_bits=63, n_probes=0).fit(archive)
+    assert len(lsh._candidates(query)) < 5
+
+    ids, scores = lsh.search(query, k=5)
+    exact_ids, exact_scores = AetherExactSearch().fit(archive).search(query, k=5)
+    assert ids.tolist() == exact_ids.tolist()
+    assert np.allclose(scores, exact_scores)
+
+def test_fallback_disabled_returns_only_candidates(archive):
+    query = archive[17]
+    lsh = AetherLSHSearch(n_tables=1, n_bits=63, n_probes=0, exact_fallback=False).fit(archive)
+    ids, _ = lsh.search(query, k=5)
+    assert len(ids) < 5
+    assert set(ids.tolist()) <= set(lsh._candidates(query).tolist())
+
+def test_wide_buckets_rank_candidates_exactly(archive):
+    query = archive[17]
+    ids, scores = AetherLSHSearch(n_tables=8, n_bits=4).fit(archive).search(query, k=3)
+    assert ids[0] == 17
+    assert np.isclose(scores[0], 1.0)
+    assert list(scores) == sorted(scores, reverse=True)
+
+def test_make_search_backend():
+    assert isinstance(make_search_backend(" LSH "), AetherLSHSearch)
+    with pytest.raises(ValueError):
+        make_search_backend("faiss")
@@ -0,0 +1,69 @@
+import pickle
+import pytest
+from src import cache as cache_module
+from src.cache import AetherResultCache
+
+class Clock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache_module.time, "time", clock)
+    return clock
+
+def test_ttl_expiry(clock):
+    cache = AetherResultCache(ttl_seconds=60)
+    cache.put("Breaking news text", {"probs": [0.2, 0.8]}, version="v1")
+    clock.now += 59
+    assert cache.get("Breaking   news text", version="v1") == {"probs": [0.2, 0.8]}
+    clock.now += 2
+    assert cache.get("Breaking news text", version="v1") is None
+    assert cache.stats()["expirations"] == 1
+
+def test_model_version_change_invalidates(clock):
+    cache = AetherResultCache()
+    cache.put("Some article", "verdict", version="v1")
+    assert cache.get("Some article", version="v2") is None
+    assert cache.stats()["invalidations"] == 1
+    assert cache.stats()["size"] == 0
+
+def test_lru_bound(clock):
+    cache = AetherResultCache(max_size=2)
+    for text in ("a", "b", "c"):
+        cache.put(text, text, version="v1")
+    assert cache.get("a", version="v1") is None
+    assert cache.stats()["evictions"] == 1
+
+def test_persistence_round_trip(tmp_path, clock):
+    path = str(tmp_path / "results.pkl")
+    cache = AetherResultCache(path=path)
+    cache.put("Some article", "verdict", version="v1")
+    assert cache.save()
+    assert AetherResultCache(path=path).get("Some article", version="v1") == "verdict"
+
+@pytest.mark.parametrize("payload", [
+    b"not a pickle at all",
+    b"cno_such_module\nFoo\n.",                       # foreign pickle: ModuleNotFoundError
+    pickle.dumps(["a", "list"]),                      # wrong shape: TypeError
+    pickle.dumps({"version": "v1", "entries": [("k", None)]}),
+    b"",
+])
+def test_corrupt_file_starts_empty(tmp_path, payload):
+    path = tmp_path / "results.pkl"
+    path.write_bytes(payload)
+    cache = AetherResultCache(path=str(path))
+    assert cache.stats()["size"] == 0
+    cache.put("Some article", "verdict", version="v1")
+    assert cache.get("Some article", version="v1") == "verdict"
+
+def test_unwritable_path_does_not_raise(tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    cache = AetherResultCache(path=str(blocker / "results.pkl"), persist_every=1)
+    cache.put("Some article", "verdict", version="v1")   # triggers a failing save
+    assert cache.save() is False
@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+from src.export import AetherCompactScorer, export_compact
+
+# Short terms only (widest is 3 chars), so longer tokens would truncate onto real terms
+TRAIN = [
+    "the cat sat",
+    "dog ran far",
+    "xyz abc top",
+    "big red fox",
+    "cat dog xyz",
+    "red top fox",
+]
+LABELS = [1, 1, 0, 0, 1, 0]
+
+@pytest.fixture(scope="module")
+def pipeline(tmp_path_factory):
+    vectorizer = TfidfVectorizer()
+    model = LogisticRegression().fit(vectorizer.fit_transform(TRAIN), LABELS)
+    out_dir = tmp_path_factory.mktemp("compact")
+    export_compact(model, vectorizer, str(out_dir))
+    return model, vectorizer, AetherCompactScorer(str(out_dir))
+
+@pytest.mark.parametrize("text", [
+    "the cat sat far",
+    "xyzzy",                                   # OOV token that truncates to the term 'xyz'
+    "abcdef xyzzy redder",
+    "the catalogue of dogma",                  # mixes real terms with long OOV prefixes
+    "",
+    "!!! ???",
+])
+def test_compact_scorer_matches_sklearn(pipeline, text):
+    model, vectorizer, scorer = pipeline
+    expected = model.predict_proba(vectorizer.transform([text]))
+    np.testing.assert_array_equal(scorer.predict_proba([text]), expected)
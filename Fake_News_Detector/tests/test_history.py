@@ -0,0 +1,59 @@
+import json
+import sqlite3
+from datetime import datetime, timedelta
+from src.history import AetherHistoryStore
+
+def stamp(hours_ago=0):
+    return (datetime.now() - timedelta(hours=hours_ago)).isoformat()
+
+def scan(text, hours_ago=0, **extra):
+    return {"timestamp": stamp(hours_ago), "text": text, "score": 0.9, "label": "AUTHENTIC", **extra}
+
+def test_add_delete_and_recent(tmp_path):
+    store = AetherHistoryStore(str(tmp_path / "history.db"), legacy_json=None)
+    old = store.add(scan("old news", hours_ago=2))
+    new = store.add(scan("new news"))
+    store.add(scan("stale news", hours_ago=48))
+    assert old != new
+
+    recent = store.recent(hours=24)
+    assert [row["text"] for row in recent] == ["new news", "old news"]
+    assert set(recent[0]) == {"id", "timestamp", "text", "score", "label"}
+
+    store.delete(old)
+    assert [row["id"] for row in store.recent(hours=24)] == [new]
+    store.clear()
+    assert store.recent(hours=24 * 365) == []
+
+def test_add_keeps_a_caller_supplied_id(tmp_path):
+    store = AetherHistoryStore(str(tmp_path / "history.db"), legacy_json=None)
+    entry = scan("tagged", id="scan-1")
+    assert store.add(entry) == "scan-1"
+    assert store.recent()[0]["id"] == "scan-1"
+
+def test_legacy_migration_skips_malformed_entries_and_runs_once(tmp_path):
+    legacy = tmp_path / "history.json"
+    legacy.write_text(json.dumps([
+        scan("kept with id", id="legacy-1"),
+        scan("kept without id"),
+        {"text": "no timestamp"},
+        {"timestamp": "not a date", "text": "bad timestamp"},
+        "not even a dict",
+    ]))
+    db_path = str(tmp_path / "history.db")
+    store = AetherHistoryStore(db_path, legacy_json=str(legacy))
+    assert sorted(row["text"] for row in store.recent()) == ["kept with id", "kept without id"]
+    assert sqlite3.connect(db_path).execute("PRAGMA user_version").fetchone()[0] == 1
+
+    # A second start must not import the file again
+    legacy.write_text(json.dumps([scan("added after migration")]))
+    assert len(AetherHistoryStore(db_path, legacy_json=str(legacy)).recent()) == 2
+
+def test_unreadable_legacy_file_is_retried(tmp_path):
+    legacy = tmp_path / "history.json"
+    legacy.write_text("{not json")
+    db_path = str(tmp_path / "history.db")
+    assert AetherHistoryStore(db_path, legacy_json=str(legacy)).recent() == []
+
+    legacy.write_text(json.dumps([scan("recovered")]))
+    assert [row["text"] for row in AetherHistoryStore(db_path, legacy_json=str(legacy)).recent()] == ["recovered"]
@@ -0,0 +1,72 @@
+import os
+import pandas as pd
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+from src.index import AetherSimilarityIndex, archive_texts
+from src.ingest import AetherCorpusStreamer, shards_current
+
+class StubLemmaCache:
+    def save(self):
+        pass
+
+class StubPreprocessor:
+    # Shards only need some cleaned total_text; the index reads title/text
+    lemma_cache = StubLemmaCache()
+
+    def worker_pool(self, n_jobs):
+        return None
+
+    def clean_many(self, texts, n_jobs=1, executor=None):
+        return [str(t).lower() for t in texts]
+
+@pytest.fixture
+def archives(tmp_path):
+    true_csv, fake_csv = str(tmp_path / "True.csv"), str(tmp_path / "Fake.csv")
+    pd.DataFrame({
+        "title": [f"Senate budget vote {i}" for i in range(7)],
+        "text": [f"Lawmakers approved spending plan number {i} after debate" for i in range(7)],
+    }).to_csv(true_csv, index=False)
+    pd.DataFrame({
+        "title": [f"Shocking alien cover-up {i}" for i in range(5)],
+        "text": [f"Insiders reveal secret base {i} hidden by elites" for i in range(5)],
+    }).to_csv(fake_csv, index=False)
+    frames = [pd.read_csv(true_csv), pd.read_csv(fake_csv)]
+    vectorizer = TfidfVectorizer().fit(archive_texts(pd.concat(frames)))
+    return tmp_path, true_csv, fake_csv, vectorizer
+
+def test_shard_index_matches_raw_index(archives):
+    tmp_path, true_csv, fake_csv, vectorizer = archives
+    shard_dir = str(tmp_path / "shards")
+    AetherCorpusStreamer(StubPreprocessor(), chunksize=3).write_shards(true_csv, fake_csv, out_dir=shard_dir)
+
+    raw = AetherSimilarityIndex(vectorizer, sources=((true_csv, 1), (fake_csv, 0)), index_dir=str(tmp_path / "raw"))
+    sharded = AetherSimilarityIndex(vectorizer, index_dir=str(tmp_path / "sharded"), shard_dir=shard_dir)
+    assert raw.refresh() and sharded.refresh()
+    assert sharded.n_rows == raw.n_rows == 12
+    for query in ("senate spending debate", "alien base elites"):
+        assert sharded.query(query, k=4) == raw.query(query, k=4)
+
+def test_shard_index_goes_unready_when_archives_change(archives):
+    tmp_path, true_csv, fake_csv, vectorizer = archives
+    shard_dir = str(tmp_path / "shards")
+    AetherCorpusStreamer(StubPreprocessor(), chunksize=3).write_shards(true_csv, fake_csv, out_dir=shard_dir)
+    assert shards_current(shard_dir)
+
+    with open(fake_csv, "a") as f:
+        f.write("Late addition,More fabricated text\n")
+    assert not shards_current(shard_dir)
+    index = AetherSimilarityIndex(vectorizer, index_dir=str(tmp_path / "sharded"), shard_dir=shard_dir)
+    assert index.refresh() is False
+    assert index.query("alien base") == []
+
+def test_rewritten_shard_set_drops_orphan_blocks(archives):
+    tmp_path, true_csv, fake_csv, vectorizer = archives
+    shard_dir, index_dir = str(tmp_path / "shards"), str(tmp_path / "sharded")
+    AetherCorpusStreamer(StubPreprocessor(), chunksize=2).write_shards(true_csv, fake_csv, out_dir=shard_dir)
+    index = AetherSimilarityIndex(vectorizer, index_dir=index_dir, shard_dir=shard_dir)
+    assert index.refresh()
+    many = len([f for f in os.listdir(index_dir) if f.endswith(".npz")])
+
+    AetherCorpusStreamer(StubPreprocessor(), chunksize=50).write_shards(true_csv, fake_csv, out_dir=shard_dir)
+    assert index.refresh() and index.n_rows == 12
+    assert len([f for f in os.listdir(index_dir) if f.endswith(".npz")]) < many
@@ -0,0 +1,23 @@
+import joblib
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+from src.inference import AetherPredictor
+
+@pytest.fixture(scope="module")
+def artifacts(tmp_path_factory):
+    texts, labels = ["senate passes budget", "aliens run the senate", "budget vote delayed", "aliens vote"], [1, 0, 1, 0]
+    vectorizer = TfidfVectorizer()
+    model = LogisticRegression().fit(vectorizer.fit_transform(texts), labels)
+    out_dir = tmp_path_factory.mktemp("artifacts")
+    model_path, vec_path = str(out_dir / "model.pkl"), str(out_dir / "vectorizer.pkl")
+    joblib.dump(model, model_path)
+    joblib.dump(vectorizer, vec_path)
+    return model_path, vec_path
+
+def test_from_artifacts_builds_the_calling_class(artifacts):
+    class ShadowPredictor(AetherPredictor):
+        pass
+
+    predictor = ShadowPredictor.from_artifacts(*artifacts, preprocessor=object())
+    assert type(predictor) is ShadowPredictor
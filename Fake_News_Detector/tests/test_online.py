@@ -0,0 +1,22 @@
+import pickle
+import numpy as np
+from src.online import AetherOnlineVectorizer
+
+def test_idf_diagonal_is_cached_until_frequencies_change():
+    vectorizer = AetherOnlineVectorizer(n_features=2 ** 10).partial_fit(["senate budget vote", "alien base"])
+    before = vectorizer.transform(["senate alien"])
+    cached = vectorizer._idf_diag
+    vectorizer.transform(["budget"])
+    assert vectorizer._idf_diag is cached
+
+    vectorizer.partial_fit(["senate senate senate"])
+    assert vectorizer._idf_diag is None
+    after = vectorizer.transform(["senate alien"])
+    assert not np.allclose(before.toarray(), after.toarray())
+
+def test_pickled_vectorizer_drops_and_rebuilds_the_cache():
+    vectorizer = AetherOnlineVectorizer(n_features=2 ** 10).partial_fit(["senate budget vote", "alien base"])
+    expected = vectorizer.transform(["senate alien"])
+    restored = pickle.loads(pickle.dumps(vectorizer))
+    assert restored._idf_diag is None
+    assert np.allclose(restored.transform(["senate alien"]).toarray(), expected.toarray())
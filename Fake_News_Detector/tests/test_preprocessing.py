@@ -0,0 +1,80 @@
+import json
+from src.preprocessing import AetherDataProcessor, AetherLemmaCache, resolve_workers
+
+class SuffixLemmatizer:
+    # Deterministic stand-in for WordNet: strips a trailing 's'
+    def lemmatize(self, word):
+        return word[:-1] if word.endswith("s") else word
+
+def test_delta_round_trip_merges_worker_entries_and_counts():
+    worker = AetherLemmaCache(SuffixLemmatizer(), max_size=100)
+    worker.track_deltas = True
+    for word in ("dogs", "cats", "dogs"):
+        worker.lemmatize(word)
+    delta = worker.take_delta()
+    assert delta == {"entries": [("dogs", "dog"), ("cats", "cat")], "hits": 1, "misses": 2}
+    assert worker.take_delta() == {"entries": [], "hits": 0, "misses": 0}
+
+    parent = AetherLemmaCache(SuffixLemmatizer(), max_size=100)
+    parent.merge(delta)
+    assert parent.stats() == {"size": 2, "hits": 1, "misses": 2, "hit_rate": 1 / 3}
+    assert parent.lemmatize("cats") == "cat"
+    assert parent.hits == 2
+
+def test_untracked_cache_does_not_queue_deltas():
+    cache = AetherLemmaCache(SuffixLemmatizer(), max_size=10)
+    for i in range(1000):
+        cache.lemmatize(f"word{i}s")
+    assert len(cache._new) == 0
+    assert cache.stats()["size"] == 10
+
+def test_tracked_delta_queue_is_bounded_by_max_size():
+    cache = AetherLemmaCache(SuffixLemmatizer(), max_size=10)
+    cache.track_deltas = True
+    for i in range(1000):
+        cache.lemmatize(f"word{i}s")
+    entries = cache.take_delta()["entries"]
+    # Only the newest max_size entries survive, matching what merge() would keep anyway
+    assert entries == [(f"word{i}s", f"word{i}") for i in range(990, 1000)]
+
+def test_save_and_load_round_trip(tmp_path):
+    path = str(tmp_path / "lemmas.json")
+    cache = AetherLemmaCache(SuffixLemmatizer(), max_size=10, path=path)
+    cache.lemmatize("dogs")
+    assert cache.save()
+    assert AetherLemmaCache(SuffixLemmatizer(), max_size=10, path=path)._store == {"dogs": "dog"}
+
+def test_load_ignores_malformed_files(tmp_path):
+    path = tmp_path / "lemmas.json"
+    path.write_text(json.dumps([["dogs", "dog"], "junk", [1, 2], ["solo"]]))
+    assert AetherLemmaCache(SuffixLemmatizer(), path=str(path))._store == {"dogs": "dog"}
+    path.write_text("{not json")
+    assert AetherLemmaCache(SuffixLemmatizer(), path=str(path))._store == {}
+
+def test_save_to_unwritable_path_returns_false(tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    cache = AetherLemmaCache(SuffixLemmatizer(), path=str(blocker / "lemmas.json"))
+    cache.lemmatize("dogs")
+    assert cache.save() is False
+
+def test_resolve_workers():
+    assert resolve_workers(0) == 1
+    assert resolve_workers(1) == 1
+    assert resolve_workers(3) == 3
+    assert resolve_workers(-1) >= 1
+
+class InlineExecutor:
+    # Stands in for a worker_pool(); deliberately exposes no worker count of its own
+    def map(self, fn, chunks):
+        return [([text.upper() for text in chunk], {"entries": [], "hits": 0, "misses": 0}) for chunk in chunks]
+
+def test_clean_many_reports_the_workers_passed_with_an_executor():
+    processor = AetherDataProcessor.__new__(AetherDataProcessor)
+    processor.lemma_cache = AetherLemmaCache(SuffixLemmatizer())
+    texts = [f"doc {i}" for i in range(10)]
+    assert processor.clean_many(texts, n_jobs=4, chunk_size=2, executor=InlineExecutor()) == [t.upper() for t in texts]
+    assert processor.last_workers == 4
+    # Never more workers than there are chunks
+    processor.clean_many(texts[:3], n_jobs=4, chunk_size=2, executor=InlineExecutor())
+    assert processor.last_workers == 2
@@ -0,0 +1,78 @@
+import asyncio
+import json
+import pytest
+from src.service import AetherInferenceService
+
+class EmptyRegistry:
+    # Artifacts missing: no predictor, no explainer
+    version = None
+
+    def get_predictor(self):
+        return None
+
+    def get_explainer(self):
+        return None
+
+class NoArchive:
+    def key(self):
+        return None
+
+    def load_archive(self):
+        return None
+
+async def _exchange(port, raw):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(raw)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, body = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), body
+
+def run_requests(*raws, ready=True):
+    async def scenario():
+        service = AetherInferenceService(registry=EmptyRegistry(), port=0, corpus_cache=NoArchive())
+        await service.start()
+        while service.ready_error == "warming up":
+            await asyncio.sleep(0.01)
+        service.ready = ready
+        try:
+            return [await _exchange(service.port, raw) for raw in raws]
+        finally:
+            await service.stop()
+    return asyncio.run(scenario())
+
+def post(path, body, headers=""):
+    return (f"POST {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\n{headers}Connection: close\r\n\r\n").encode() + body
+
+@pytest.mark.parametrize("raw, status", [
+    (b"POST /predict HTTP/1.1\r\nContent-Length: abc\r\nConnection: close\r\n\r\n", 400),
+    (b"POST /predict HTTP/1.1\r\nContent-Length: -5\r\nConnection: close\r\n\r\n", 400),
+    ("POST /predict HTTP/1.1\r\nContent-Length: ²\r\nConnection: close\r\n\r\n".encode("latin-1"), 400),
+    (b"POST /predict HTTP/1.1\r\nContent-Length: 99999999999\r\nConnection: close\r\n\r\n", 413),
+    (b"POST /predict HTTP/1.1\r\nTransfer-Encoding: chunked\r\nConnection: close\r\n\r\n5\r\nhello\r\n0\r\n\r\n", 501),
+    (b"garbage\r\n\r\n", 400),
+    (b"GET /nowhere HTTP/1.1\r\nConnection: close\r\n\r\n", 404),
+    (b"GET /predict HTTP/1.1\r\nConnection: close\r\n\r\n", 405),
+    (post("/audit", b"{not json"), 400),
+    (post("/audit", b"[1, 2]"), 400),
+    (post("/audit", b'{"text": ""}'), 400),
+])
+def test_request_parsing(raw, status):
+    (got, _), = run_requests(raw)
+    assert got == status
+
+def test_engine_endpoints_answer_503_without_artifacts():
+    body = json.dumps({"text": "The senate passed the budget bill today"}).encode()
+    responses = run_requests(post("/audit", body), post("/related", body), post("/predict", body))
+    assert [status for status, _ in responses] == [503, 503, 503]
+    assert json.loads(responses[1][1]) == {"error": "Neural engine unavailable."}
+
+def test_not_ready_and_health():
+    (ready, _), (health, body) = run_requests(
+        b"GET /ready HTTP/1.1\r\nConnection: close\r\n\r\n",
+        b"GET /health HTTP/1.1\r\nConnection: close\r\n\r\n",
+        ready=False,
+    )
+    assert (ready, health) == (503, 200)
+    assert json.loads(body) == {"status": "alive"}
@@ -1,42 +1,95 @@
-from src.training import AetherNeuralEngine
-from src.data_generator import create_sample_data
-import os
-import time
-
-def clear_console():
-    os.system('cls' if os.name == 'nt' else 'clear')
-
-def main():
-    clear_console()
-    print("="*60)
-    print("       AETHER NEURAL SENTINEL - MISSION CONTROL v2.5.0")
-    print("="*60)
-    
-    if not os.path.exists('data/raw/True.csv') or not os.path.exists('data/raw/Fake.csv'):
-        print("[!] SIGNAL LOST: Raw archives not found.")
-        print("[!] INITIATING SAMPLE DATA GENERATION...")
-        create_sample_data()
-        time.sleep(1)
-    
-    print("[+] INITIALIZING NEURAL ENGINE...")
-    engine = AetherNeuralEngine()
-    
-    print("[+] SYNCHRONIZING WITH ARCHIVES...")
-    df = engine.prepare_data('data/raw/True.csv', 'data/raw/Fake.csv')
-    
-    print("[+] CALIBRATING NEURAL WEIGHTS...")
-    metrics = engine.train(df)
-    
-    print("\n" + "-"*60)
-    print("     NEURAL CALIBRATION COMPLETE - PERFORMANCE REPORT")
-    print("-"*60)
-    print(f" ACCURACY SCORE: {metrics['accuracy']:.4%}")
-    print(f" ROC-AUC METRIC: {metrics['roc_auc']:.4%}")
-    print("\n[CLASSIFICATION_LOGS]")
-    print(metrics['report'])
-    print("="*60)
-    print("   SENTINEL READY - DEPLOY WITH 'streamlit run app.py'")
-    print("="*60)
-
-if __name__ == "__main__":
-    main()
+from src.training import AetherNeuralEngine
+from src.data_generator import create_sample_data
+from src.ingest import AetherCorpusStreamer
+from src.preprocessing import AetherDataProcessor
+from src.export import export_compact
+import argparse
+import os
+import time
+
+def clear_console():
+    os.system('cls' if os.name == 'nt' else 'clear')
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Aether Neural Sentinel training sequence.")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Processes used for text cleaning (-1 = all cores).")
+    parser.add_argument("--lemma-cache", default=None,
+                        help="Optional JSON file to load/persist the token->lemma cache.")
+    parser.add_argument("--chunksize", type=int, default=None,
+                        help="Stream the archives through cleaned shards (data/shards) in chunks of this size.")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Re-clean the corpus even if a preprocessed cache matches the raw archives.")
+    parser.add_argument("--online", action="store_true",
+                        help="Out-of-core training: hashed features + SGD partial_fit, checkpointed to models/.")
+    parser.add_argument("--feed", action="append", default=[],
+                        help="Labeled CSV (title, text, target) to fold into the online checkpoint. Repeatable.")
+    parser.add_argument("--export-compact", action="store_true",
+                        help="Also write the memory-mappable NumPy export to models/compact.")
+    return parser.parse_args()
+
+def run_online(args):
+    from src.online import AetherOnlineTrainer
+    print("[+] RESUMING ONLINE ENGINE...")
+    trainer = AetherOnlineTrainer.resume()
+    preprocessor = AetherDataProcessor(lemma_cache_path=args.lemma_cache)
+    chunksize = args.chunksize or 5000
+
+    if args.feed:
+        for feed in args.feed:
+            print(f"[+] FOLDING IN FEED {feed}...")
+            trainer.fold_in_csv(feed, preprocessor, chunksize=chunksize, n_jobs=args.workers)
+    else:
+        print("[+] STREAMING NEW ARCHIVE ROWS THROUGH PARTIAL_FIT...")
+        streamer = AetherCorpusStreamer(preprocessor, chunksize=chunksize)
+        trainer.fold_in_archives(streamer, 'data/raw/True.csv', 'data/raw/Fake.csv', n_jobs=args.workers)
+    preprocessor.lemma_cache.save()
+
+    print("\n" + "-"*60)
+    print(f" PROGRESSIVE ACCURACY: {trainer.progressive_accuracy():.4%}")
+    print(f" SAMPLES ABSORBED:     {trainer.samples_seen}")
+    print("="*60)
+
+def main():
+    args = parse_args()
+    clear_console()
+    print("="*60)
+    print("       AETHER NEURAL SENTINEL - MISSION CONTROL v2.5.0")
+    print("="*60)
+    
+    # Feed-only runs never read the archives, so they must not fabricate them either
+    archives_missing = not os.path.exists('data/raw/True.csv') or not os.path.exists('data/raw/Fake.csv')
+    if archives_missing and not args.feed:
+        print("[!] SIGNAL LOST: Raw archives not found.")
+        print("[!] INITIATING SAMPLE DATA GENERATION...")
+        create_sample_data()
+        time.sleep(1)
+    
+    if args.online or args.feed:
+        run_online(args)
+        return
+    
+    print("[+] INITIALIZING NEURAL ENGINE...")
+    engine = AetherNeuralEngine(lemma_cache_path=args.lemma_cache)
+    
+    print("[+] SYNCHRONIZING WITH ARCHIVES...")
+    df = engine.prepare_data('data/raw/True.csv', 'data/raw/Fake.csv', n_jobs=args.workers, chunksize=args.chunksize, use_cache=not args.no_cache)
+    
+    print("[+] CALIBRATING NEURAL WEIGHTS...")
+    metrics = engine.train(df)
+    if args.export_compact:
+        export_compact(engine.model, engine.vectorizer)
+    
+    print("\n" + "-"*60)
+    print("     NEURAL CALIBRATION COMPLETE - PERFORMANCE REPORT")
+    print("-"*60)
+    print(f" ACCURACY SCORE: {metrics['accuracy']:.4%}")
+    print(f" ROC-AUC METRIC: {metrics['roc_auc']:.4%}")
+    print("\n[CLASSIFICATION_LOGS]")
+    print(metrics['report'])
+    print("="*60)
+    print("   SENTINEL READY - DEPLOY WITH 'streamlit run app.py'")
+    print("="*60)
+
+if __name__ == "__main__":
+    main()